@@ -1,96 +1,529 @@
-"""
-HeyGen Batch Video Automation
-=============================
-Uses Playwright persistent context (profile-based approach).
-Can run in headless or non-headless mode.
-
-SETUP:
-1. Run setup_profile.py first to create a logged-in Chrome profile
-2. Then run this script for the full automation
-"""
-
+"""
+HeyGen Batch Video Automation
+=============================
+Uses Playwright persistent context (profile-based approach).
+Can run in headless or non-headless mode.
+
+SETUP:
+1. Run setup_profile.py first to create a logged-in Chrome profile
+2. Then run this script for the full automation
+"""
+
 import os
+import re
 import time
 import json
 import argparse
+import functools
+import importlib.metadata
+import multiprocessing
+import queue
+import shutil
 import sys
-from datetime import datetime
-from pathlib import Path
-from playwright.sync_api import sync_playwright
-
-# ============================================
-# CONFIGURATION - EDIT THESE PATHS
-# ============================================
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROFILE_DIR = os.path.join(SCRIPT_DIR, "chrome_profile")
-BASE_DIR = os.path.dirname(SCRIPT_DIR)  # Parent of HeadlessTest folder
-
-# You can change these to your preferred locations
-INPUT_FILES_DIR = os.path.join(BASE_DIR, "inputFiles")
-OUTPUT_FILES_DIR = os.path.join(BASE_DIR, "outputFiles")
-TRACKING_FILE = os.path.join(SCRIPT_DIR, "tracking.json")
-
-# Headless mode - set to True to run invisibly
-RUN_HEADLESS = False       # Change to True once you confirm headless works
-
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeoutError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# Suffixes of downloads that are still being written
+_PARTIAL_DOWNLOAD_SUFFIXES = ('.crdownload', '.tmp')
+# A download written under its final name counts as complete once unchanged this long
+_DOWNLOAD_STABLE_SECONDS = 2
+
+
+class _DownloadDirHandler(FileSystemEventHandler):
+    """Wakes wait_for_latest_download on directory changes (used when watchdog is installed)"""
+
+    def __init__(self):
+        super().__init__()
+        self.changed = threading.Event()
+        self.completed = None  # File a partial download was renamed to
+
+    def on_any_event(self, event):
+        self.changed.set()
+
+    def on_moved(self, event):
+        if (not event.is_directory and event.src_path.endswith(_PARTIAL_DOWNLOAD_SUFFIXES)
+                and not event.dest_path.endswith(_PARTIAL_DOWNLOAD_SUFFIXES)):
+            self.completed = event.dest_path
+        self.changed.set()
+
+
+# ============================================
+# CONFIGURATION - EDIT THESE PATHS
+# ============================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(SCRIPT_DIR, "chrome_profile")
+BASE_DIR = os.path.dirname(SCRIPT_DIR)  # Parent of HeadlessTest folder
+
+# You can change these to your preferred locations
+INPUT_FILES_DIR = os.path.join(BASE_DIR, "inputFiles")
+OUTPUT_FILES_DIR = os.path.join(BASE_DIR, "outputFiles")
+TRACKING_FILE = os.path.join(SCRIPT_DIR, "tracking.json")
+CONFIG_FILE = os.path.join(SCRIPT_DIR, "config.txt")
+
+# Headless mode - set to True to run invisibly
+RUN_HEADLESS = False       # Change to True once you confirm headless works
+
+# Browsers used to submit a project's scenes side by side (1 = one at a time).
+# The main browser is one of them; each extra browser runs on its own copy of the Chrome profile.
+try:
+    SUBMISSION_CONCURRENCY = max(1, int(os.getenv("HEYGEN_CONCURRENCY", "1")))
+except ValueError:
+    print(f"⚠️ Ignoring HEYGEN_CONCURRENCY={os.getenv('HEYGEN_CONCURRENCY')!r}; expected a whole number")
+    SUBMISSION_CONCURRENCY = 1
+
 # Poll interval for checking new downloads (in seconds)
-POLLING_SLEEP_SECONDS = 90
-
-
+POLLING_SLEEP_SECONDS = 90      # Longest wait between download poll cycles
+POLLING_MIN_SLEEP_SECONDS = 15  # First wait, and the wait after a cycle that downloaded something
+POLLING_BACKOFF = 1.5
+
+# Date/time prefix of the HeyGen folder created for each project
+FOLDER_DATETIME_FORMAT = "%m-%d-%Y %I-%M %p"
+
+# Deferred tracking saves within this window are coalesced into one write
+TRACKING_SAVE_INTERVAL_SECONDS = 1.0
+DEFAULT_ACTION_TIMEOUT_MS = 3000
+# Steps that wait on a HeyGen server round-trip (folder creation, folder picker, Submit)
+SERVER_ACTION_TIMEOUT_MS = 30000
+DEFAULT_NAVIGATION_TIMEOUT_MS = 10000
+
+# Oldest Playwright release with Locator.filter(visible=...), used for avatar and editor lookups
+MIN_PLAYWRIGHT_VERSION = (1, 51)
+
+# Maximum script length accepted by the HeyGen editor (in characters)
+SCRIPT_CHAR_LIMIT = 25000
+
+# Key of the avatar list line in config.txt
+AVATARS_CONFIG_KEY = "available_avatars:"
+
+# Clickable avatar card container in the avatar grid
+AVATAR_CARD_SELECTOR = 'div[class*="tw-rounded-[20px]"]'
+VIDEO_CARD_SELECTOR = 'div.tw-group:has(iconpark-icon[name="play"])'
+AVATAR_MENU_SELECTORS = (
+    '[data-testid="my-avatars-menu"]',
+    'button:has-text("My avatars")',
+    'button:has-text("My Avatars")',
+    'a:has-text("Avatars")',
+    'button:has-text("Avatars")',
+)
+# Any of the buttons that confirm the picked avatar, as a single compound selector
+USE_AVATAR_BUTTON_SELECTOR = ", ".join([
+    'button:has-text("Use in video")',
+    'button:has-text("Use this avatar")',
+    'button:has-text("Use avatar")',
+])
+
+# One project selection token: a number ("2") or a range ("1-3")
+_SELECTION_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+
+# Greedy match up to the last sentence ending; one scan instead of an rfind per character
+_SENTENCE_END_RE = re.compile(r".*[.!?\n]", re.DOTALL)
+
+# HeyGen API calls the web app makes about videos, and a finished render in their JSON.
+# Seeing one for a video that is still pending while the polling loop waits ends the wait early.
+_RENDER_STATUS_URL_RE = re.compile(r"//api\d*\.heygen\.com/.*video", re.IGNORECASE)
+_RENDER_COMPLETED_RE = re.compile(r'"status"\s*:\s*"(?:completed|success)"')
+_RENDER_COMPLETED_STATUSES = ("completed", "success")
+# Keys of a video object in those responses that may hold its name
+_RENDER_NAME_KEYS = ("name", "title", "video_name", "video_title")
+
+# In-page dialog dismisser shared by the popup watchdog and _dismiss_modal_overlays.
+# Clicks the first close-like button in the first visible dialog (optionally only
+# dialogs containing textNeedle). Returns {dismissed: true}, or the dialog's corner
+# as {dismissed: false, backdrop: {x, y}} when it has no such button, or null.
+_DISMISS_DIALOG_JS = """
+(options) => {
+  const wanted = options.labels.map((label) => label.toLowerCase());
+  const dialogs = document.querySelectorAll('div.tw-stack-dialog, div.rc-dialog-wrap, [role="dialog"]');
+  for (const dialog of dialogs) {
+    if (!dialog.getClientRects().length || getComputedStyle(dialog).visibility === "hidden") {
+      continue;
+    }
+    if (options.textNeedle && !(dialog.innerText || "").includes(options.textNeedle)) {
+      continue;
+    }
+    const buttons = Array.from(dialog.querySelectorAll("button"));
+    const target = buttons.find((btn) => {
+      const label = (btn.getAttribute("aria-label") || "").toLowerCase();
+      if (label.includes("close")) {
+        return true;
+      }
+      return wanted.includes((btn.innerText || "").trim().toLowerCase());
+    });
+    if (target) {
+      target.click();
+      return { dismissed: true };
+    }
+    const rect = dialog.getBoundingClientRect();
+    return { dismissed: false, backdrop: { x: rect.left + 10, y: rect.top + 10 } };
+  }
+  return null;
+}
+"""
+
+# Maps each wanted video name to the index of the first folder card whose text contains it
+_INDEX_VIDEO_CARDS_JS = """(args) => {
+    const out = {};
+    document.querySelectorAll(args.selector).forEach((card, i) => {
+        const text = card.innerText;
+        for (const name of args.names) {
+            if (!(name in out) && text.includes(name)) out[name] = i;
+        }
+    });
+    return out;
+}"""
+
+# True once at least one folder card is present and the card count has not changed for
+# quietMs (cards render in batches after a reload); the last count lives on window
+_CARD_COUNT_SETTLED_JS = """(args) => {
+    const count = document.querySelectorAll(args.selector).length;
+    const now = performance.now();
+    const last = window.__heygenCardCount;
+    if (!last || last.count !== count) {
+        window.__heygenCardCount = { count: count, since: now };
+        return false;
+    }
+    return count > 0 && now - last.since >= args.quietMs;
+}"""
+
+# True once the script editor's text length reaches minLength (or is empty when minLength is 0)
+_EDITOR_TEXT_LENGTH_JS = """(args) => {
+    let length = 0;
+    document.querySelectorAll(args.selector).forEach((el) => { length += el.innerText.length; });
+    return args.minLength === 0 ? length === 0 : length >= args.minLength;
+}"""
+
+# Total text length of the script editor
+_EDITOR_TEXT_COUNT_JS = """(selector) => {
+    let length = 0;
+    document.querySelectorAll(selector).forEach((el) => { length += el.innerText.length; });
+    return length;
+}"""
+
+# Opens the labelled combobox in the Generate modal and picks the option containing value.
+# Pointer events are dispatched as well as click() since some select triggers open on pointerdown.
+# Returns "picked" once the trigger shows value, "unconfirmed" if it doesn't after the click,
+# "no-option" (dropdown closed again) if value isn't offered, or "missing" if there is no such field.
+_SET_COMBOBOX_JS = """async ({label, value}) => {
+    const press = (el) => {
+        for (const type of ['pointerdown', 'mousedown', 'pointerup', 'mouseup']) {
+            const Event_ = type.startsWith('pointer') ? PointerEvent : MouseEvent;
+            el.dispatchEvent(new Event_(type, {bubbles: true, cancelable: true, button: 0, pointerType: 'mouse'}));
+        }
+        el.click();
+    };
+    const nextFrame = () => new Promise((resolve) => requestAnimationFrame(resolve));
+    const field = [...document.querySelectorAll('div.tw-flex.tw-flex-col.tw-gap-1')].find(
+        (d) => d.innerText.includes(label) && d.querySelectorAll('button[role="combobox"]').length === 1
+    );
+    if (!field) return 'missing';
+    const trigger = field.querySelector('button[role="combobox"]');
+    press(trigger);
+    for (let frame = 0; frame < 60; frame++) {
+        await nextFrame();
+        const option = [...document.querySelectorAll('[data-item-label="true"]')].find(
+            (o) => o.innerText.includes(value)
+        );
+        if (option) {
+            press(option);
+            for (let wait = 0; wait < 30; wait++) {
+                await nextFrame();
+                if (trigger.innerText.includes(value)) return 'picked';
+            }
+            return 'unconfirmed';
+        }
+    }
+    if (trigger.getAttribute('aria-expanded') === 'true') press(trigger);
+    return 'no-option';
+}"""
+
+# Text shown on the labelled Generate-modal combobox, or null if there is no such field
+_COMBOBOX_TEXT_JS = """(label) => {
+    const field = [...document.querySelectorAll('div.tw-flex.tw-flex-col.tw-gap-1')].find(
+        (d) => d.innerText.includes(label) && d.querySelectorAll('button[role="combobox"]').length === 1
+    );
+    return field ? field.querySelector('button[role="combobox"]').innerText : null;
+}"""
+
+# Characters that are invalid in Windows filenames, all mapped to '-'
+_SANITIZE_TABLE = str.maketrans({char: '-' for char in '/\\:|*?"<>'})
+
+
+class _BrowserPool:
+    """Keeps launched browser contexts warm between run_* calls in one process.
+    Contexts are closed (and Playwright stopped) by close_all(), which run() calls on the way out.
+    """
+
+    def __init__(self, launch):
+        self._launch = launch  # callable(playwright) -> context or None
+        self._playwright = None
+        self._idle = queue.Queue()
+        self._contexts = []
+
+    def acquire(self):
+        """Return an idle context, launching a new one if none is free (None if launch failed)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        context = self._launch(self._playwright)
+        if context is not None:
+            self._contexts.append(context)
+        return context
+
+    def release(self, context):
+        """Hand a context back for the next run_* call"""
+        if context is not None:
+            self._idle.put(context)
+
+    def close_all(self):
+        for context in self._contexts:
+            try:
+                context.close()
+            except Exception:
+                pass
+        if self._contexts:
+            print("✅ Browser closed.")
+        self._contexts = []
+        self._idle = queue.Queue()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                print(f"⚠️ Could not stop Playwright: {e}")
+            self._playwright = None
+
+
 class HeyGenAutomation:
     def __init__(self):
         """Initialize automation paths, defaults, and required directories."""
         self.profile_dir = PROFILE_DIR
+        self.cdp_url = os.getenv("HEYGEN_CDP_URL", "").strip()
         self.input_files_dir = INPUT_FILES_DIR
         self.output_files_dir = OUTPUT_FILES_DIR
         self.tracking_file = TRACKING_FILE
+        self.config_file = CONFIG_FILE
         self.headless = RUN_HEADLESS
-        
-        # Create directories if needed
-        os.makedirs(self.input_files_dir, exist_ok=True)
-        os.makedirs(self.output_files_dir, exist_ok=True)
-    
-    # ============================================
-    # JSON TRACKING FUNCTIONS
-    # ============================================
-    
-    def load_tracking(self):
-        """Load tracking data from JSON file"""
-        try:
-            if os.path.exists(self.tracking_file):
-                with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"⚠️ Error loading tracking file: {e}")
-        return None
-    
-    def save_tracking(self, data):
-        """Save tracking data to JSON file"""
-        try:
-            with open(self.tracking_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"❌ Error saving tracking file: {e}")
-            return False
-    
+
+        # Lookup indexes for the tracking data currently in use
+        self._indexed_tracking = None
+        self._project_index = {}  # project_name -> project entry
+        self._video_index = {}    # scene_folder -> video entry
+
+        # (path, mtime_ns, size) of config.txt and the avatars parsed from it
+        self._config_cache = (None, [])
+
+        # Tracking data whose write was deferred by save_tracking(defer=True), and since when
+        self._pending_tracking = None
+        self._pending_since = None
+
+        # Memoized Locators for static selectors, cleared on navigation
+        self._locators = {}
+        self._locator_page = None
+
+        self.submission_concurrency = SUBMISSION_CONCURRENCY
+
+        # Browser contexts reused across run_* calls; closed when run() returns
+        self._browser_pool = _BrowserPool(self.launch_browser)
+
+        # Editor shortcuts for this platform
+        modifier_key = "Meta" if sys.platform == "darwin" else "Control"
+        self._select_all_key = f"{modifier_key}+a"
+        self._paste_key = f"{modifier_key}+v"
+
+        # Folder the page is currently showing, and its URL if the folder view has its own
+        self._current_folder = None
+        self._current_folder_url = None
+        
+        # Create directories if needed
+        os.makedirs(self.input_files_dir, exist_ok=True)
+        os.makedirs(self.output_files_dir, exist_ok=True)
+    
+    # ============================================
+    # JSON TRACKING FUNCTIONS
+    # ============================================
+    
+    @property
+    def tracking_log_file(self):
+        """Append-only log of tracking changes made since tracking_file was last written"""
+        return self.tracking_file + ".log"
+
+    def load_tracking(self):
+        """Load tracking data from JSON file, replaying any logged changes on top"""
+        self.flush_tracking()
+        try:
+            with open(self.tracking_file, 'rb') as f:
+                raw = f.read()
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw.decode('utf-8'))
+            self._index_tracking(data)
+            self._replay_tracking_log(data)
+            return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Error loading tracking file: {e}")
+        return None
+    
+    def save_tracking(self, data, defer=False):
+        """Save tracking data to JSON file.
+        With defer=True the write is held back and coalesced with later deferred saves;
+        it goes out once TRACKING_SAVE_INTERVAL_SECONDS have passed, or on flush_tracking().
+        """
+        if defer:
+            now = time.monotonic()
+            if self._pending_tracking is None:
+                self._pending_since = now
+            self._pending_tracking = data
+            if now - self._pending_since < TRACKING_SAVE_INTERVAL_SECONDS:
+                return True
+        self._pending_tracking = None
+        self._pending_since = None
+
+        try:
+            if orjson is not None:
+                raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            # Write a temp file and swap it in so a crash never leaves a truncated file
+            tmp_path = self.tracking_file + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, self.tracking_file)
+        except Exception as e:
+            print(f"❌ Error saving tracking file: {e}")
+            return False
+
+        # The full file now includes every logged change
+        try:
+            os.remove(self.tracking_log_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ Could not clear tracking log: {e}")
+        return True
+
+    def append_tracking_event(self, event):
+        """Append a single tracking change to the log instead of rewriting tracking_file.
+        load_tracking() replays the log; the next save_tracking() folds it in.
+        """
+        # Logged events apply on top of tracking_file, so it must be current first
+        if not self.flush_tracking():
+            return False
+        try:
+            if orjson is not None:
+                line = orjson.dumps(event) + b"\n"
+            else:
+                line = (json.dumps(event, ensure_ascii=False) + "\n").encode('utf-8')
+            with open(self.tracking_log_file, 'ab') as f:
+                f.write(line)
+            return True
+        except Exception as e:
+            print(f"❌ Error writing tracking log: {e}")
+            return False
+
+    def _replay_tracking_log(self, tracking_data):
+        """Apply events from the tracking log to freshly loaded tracking_data"""
+        try:
+            f = open(self.tracking_log_file, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    # A partially written last line (e.g. killed mid-append)
+                    break
+                op = event.get("op")
+                if op == "add_video":
+                    project = self._project_index.get(event["project"])
+                    video = event["video"]
+                    # Skip videos already folded into the file by an interrupted save
+                    if project is not None and all(v["video_name"] != video["video_name"] for v in project["videos"]):
+                        project["videos"].append(video)
+                        self._video_index.setdefault(video["scene_folder"], video)
+                elif op == "update":
+                    self.update_video_status(
+                        tracking_data, event["scene_folder"], event["status"],
+                        event.get("output_file"), event.get("error_message"), timestamp=event.get("timestamp")
+                    )
+
+    def record_video_status(self, tracking_data, scene_folder, status, output_file=None, error_message=None):
+        """Update a video's status and append the change to the tracking log"""
+        timestamp = datetime.now().isoformat()
+        self.update_video_status(tracking_data, scene_folder, status, output_file, error_message, timestamp=timestamp)
+        return self.append_tracking_event({
+            "op": "update",
+            "scene_folder": scene_folder,
+            "status": status,
+            "output_file": output_file,
+            "error_message": error_message,
+            "timestamp": timestamp,
+        })
+
+    def flush_tracking(self):
+        """Write out tracking data deferred by save_tracking(defer=True), if any.
+        Called at mode boundaries and when run() returns.
+        """
+        if self._pending_tracking is None:
+            return True
+        return self.save_tracking(self._pending_tracking)
+    
     def load_config(self):
-        """Load avatar configuration from config.txt"""
-        config_path = os.path.join(os.path.dirname(self.tracking_file), "config.txt")
+        """Load avatar configuration from config.txt (cached until the file changes)"""
+        config_path = self.config_file
         avatars = []
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    for line in content.splitlines():
-                        if "available_avatars:" in line:
-                            parts = line.split("available_avatars:")[1].split(",")
-                            avatars = [nominal.strip() for nominal in parts if nominal.strip()]
-            else:
-                print(f"⚠️ config.txt not found at {config_path}")
-        except Exception as e:
+        try:
+            stat = os.stat(config_path)
+            cache_key = (config_path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key is not None and self._config_cache[0] == cache_key:
+            return list(self._config_cache[1])
+
+        try:
+            if cache_key is not None:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    # Stream the file and stop at the first avatar line
+                    for line in f:
+                        _, found, value = line.partition(AVATARS_CONFIG_KEY)
+                        if found:
+                            names = (nominal.strip() for nominal in value.split(","))
+                            avatars = [nominal for nominal in names if nominal]
+                            break
+            else:
+                print(f"⚠️ config.txt not found at {config_path}")
+        except Exception as e:
              print(f"⚠️ Error loading config.txt: {e}")
-        return avatars
+
+        # Precompile search patterns so avatar lookups are a cache hit
+        for name in avatars:
+            self._compile_avatar_pattern(name)
+        if cache_key is not None:
+            self._config_cache = (cache_key, avatars)
+        return list(avatars)
 
     def load_ui_queue(self, queue_path):
         """Load queue data created by the web UI"""
@@ -102,297 +535,397 @@ class HeyGenAutomation:
         except Exception as e:
             print(f"⚠️ Error loading UI queue: {e}")
         return None
-
-    def create_new_tracking_session(self):
-        """Create new tracking session structure"""
-        return {
-            "session_start": datetime.now().isoformat(),
-            "projects": []
-        }
-
-    def add_project_to_tracking(self, tracking_data, project_name, heygen_folder_name, config):
-        """Add a project to the current tracking session"""
-        project_entry = {
-            "project_name": project_name,
-            "heygen_folder_name": heygen_folder_name,
-            "started_at": datetime.now().isoformat(),
-            "config": config,
-            "videos": [],
-            "status": "processing"
-        }
-        if "projects" not in tracking_data:
-             tracking_data["projects"] = []
-             
-        tracking_data["projects"].append(project_entry)
-        return project_entry
-
-    def add_video_to_project(self, tracking_data, project_name, scene_folder, script_file, video_name):
-        """Add video to a specific project in tracking"""
-        for project in tracking_data.get("projects", []):
-            if project["project_name"] == project_name:
-                video_entry = {
-                    "scene_folder": scene_folder,
-                    "script_file": script_file,
-                    "video_name": video_name,
-                    "submitted_at": datetime.now().isoformat(),
-                    "status": "processing",
-                    "downloaded_at": None,
-                    "output_file": None,
-                    "error_message": None
-                }
-                project["videos"].append(video_entry)
-                return video_entry
-        return None
-
-    def update_video_status(self, tracking_data, scene_folder, status, output_file=None, error_message=None):
-        """Update status of a video in tracking (searches all projects)"""
-        for project in tracking_data.get("projects", []):
-            for video in project["videos"]:
-                if video["scene_folder"] == scene_folder:
-                    video["status"] = status
-                    if status == "downloaded":
-                        video["downloaded_at"] = datetime.now().isoformat()
-                        video["output_file"] = output_file
-                    if error_message:
-                        video["error_message"] = error_message
-                    return
-    
-    # ============================================
-    # CLI / USER INPUT FUNCTIONS
-    # ============================================
-    
-    def get_mode_selection(self):
-        """Prompt user to select operation mode"""
-        print("\n" + "="*60)
-        print("🎬 HEYGEN BATCH VIDEO AUTOMATION")
-        print("   (Persistent Context Mode)")
-        print("="*60 + "\n")
-        
-        print(f"📁 Profile: {self.profile_dir}")
-        print(f"🖥️ Mode: {'Headless' if self.headless else 'Visible'}")
-        print("")
-        
-        print("Select operation mode:")
-        print("  1. Submit new videos")
-        print("  2. Check & download pending videos")
-        print("  3. Submit & download (unattended overnight mode)")
-        print("")
-        
-        while True:
-            choice = input("👉 Enter your choice (1, 2, or 3): ").strip()
-            if choice == "1":
-                return "submit"
-            elif choice == "2":
-                return "download"
-            elif choice == "3":
-                return "unattended"
-            else:
-                print("❌ Invalid choice. Please enter 1, 2, or 3")
-    
-    def get_project_info(self):
-        """
-        Scan inputFiles for Projects and their Scenes
-        Returns: (project_name, list of (scene_folder_name, script_path, script_filename))
-        """
-        try:
-            input_path = Path(self.input_files_dir)
-            
-            # Get all project folders (first level)
-            projects = [f for f in input_path.iterdir() if f.is_dir()]
-            
-            if not projects:
-                raise Exception(f"No project folders found in {self.input_files_dir}")
-        
-            # Display projects with their scenes
-            print("\n" + "="*60)
-            print("📂 AVAILABLE PROJECTS")
-            print("="*60 + "\n")
-            
-            project_info_list = [] # List of (project_obj, scenes_list)
-            
-            for idx, project in enumerate(projects, 1):
-                # Get scene folders within this project
-                scenes = [s for s in project.iterdir() if s.is_dir()]
-                project_info_list.append((project, scenes))
-                
-                print(f"  {idx}. {project.name}")
-                for scene in scenes:
-                    # Find script file in scene
-                    text_files = list(scene.glob("*.txt")) + list(scene.glob("*.text"))
-                    script_status = f"({text_files[0].name})" if text_files else "(no script found)"
-                    print(f"      └── {scene.name} {script_status}")
-                print("")
-        
-            # Get user selection (Multi-select)
-            selected_projects_data = [] # List of (project_name, scene_list)
-            
-            while True:
-                try:
-                    selection = input(f"👉 Select project (e.g. 1-3, '1,2', 'all'): ").strip().lower()
-                    
-                    indices = set()
-                    if selection in ['all', 'a']:
-                        indices = set(range(len(projects)))
-                    else:
-                        # Parse ranges and commas
-                        parts = selection.replace(',', ' ').split()
-                        for part in parts:
-                            if '-' in part:
-                                start, end = map(int, part.split('-'))
-                                indices.update(range(start-1, end))
-                            else:
-                                indices.add(int(part) - 1)
-                    
-                    # Validate indices
-                    valid_indices = [i for i in indices if 0 <= i < len(projects)]
-                    
-                    if not valid_indices:
-                         print("❌ No valid projects selected.")
-                         continue
-                         
-                    print(f"✅ Selected {len(valid_indices)} project(s).")
-                    
-                    for idx in sorted(valid_indices):
-                        selected_project, scenes = project_info_list[idx]
-                        
-                        # Build scene list for this project
-                        current_scene_list = []
-                        for scene in scenes:
-                            text_files = list(scene.glob("*.txt")) + list(scene.glob("*.text"))
-                            if text_files:
-                                script_file = text_files[0]
-                                current_scene_list.append((scene.name, str(script_file), script_file.stem))
-                        
-                        if current_scene_list:
-                             selected_projects_data.append((selected_project.name, current_scene_list))
-                        else:
-                            print(f"⚠️ Skipping {selected_project.name} (no scripts found)")
-    
-                    if not selected_projects_data:
-                         print("❌ No valid scenes found in selected projects.")
-                         continue
-                         
-                    break
-    
-                except ValueError:
-                    print("❌ Invalid input format.")
-            
-            return selected_projects_data
-            
-        except Exception as e:
-            print(f"❌ Error reading project info: {e}")
-            raise
-    
-    def read_script_file(self, script_path):
-        """Read the script content from file"""
+
+    def create_new_tracking_session(self):
+        """Create new tracking session structure"""
+        tracking_data = {
+            "session_start": datetime.now().isoformat(),
+            "projects": []
+        }
+        self._index_tracking(tracking_data)
+        return tracking_data
+
+    def _index_tracking(self, tracking_data):
+        """(Re)build the project/video lookup indexes when tracking_data changes.
+        The first entry for a name wins, matching the old linear search order.
+        """
+        if tracking_data is self._indexed_tracking:
+            return
+        self._project_index = {}
+        self._video_index = {}
+        if isinstance(tracking_data, dict):
+            for project in tracking_data.get("projects", []):
+                self._project_index.setdefault(project["project_name"], project)
+                for video in project["videos"]:
+                    self._video_index.setdefault(video["scene_folder"], video)
+        self._indexed_tracking = tracking_data
+
+    def add_project_to_tracking(self, tracking_data, project_name, heygen_folder_name, config, timestamp=None):
+        """Add a project to the current tracking session (timestamp: ISO string, default now)"""
+        project_entry = {
+            "project_name": project_name,
+            "heygen_folder_name": heygen_folder_name,
+            "started_at": timestamp or datetime.now().isoformat(),
+            "config": config,
+            "videos": [],
+            "status": "processing"
+        }
+        if "projects" not in tracking_data:
+             tracking_data["projects"] = []
+             
+        self._index_tracking(tracking_data)
+        tracking_data["projects"].append(project_entry)
+        self._project_index.setdefault(project_name, project_entry)
+        return project_entry
+
+    def add_video_to_project(self, tracking_data, project_name, scene_folder, script_file, video_name, timestamp=None):
+        """Add video to a specific project in tracking (timestamp: ISO string, default now)"""
+        self._index_tracking(tracking_data)
+        project = self._project_index.get(project_name)
+        if project is None:
+            return None
+
+        video_entry = {
+            "scene_folder": scene_folder,
+            "script_file": script_file,
+            "video_name": video_name,
+            "submitted_at": timestamp or datetime.now().isoformat(),
+            "status": "processing",
+            "downloaded_at": None,
+            "output_file": None,
+            "error_message": None
+        }
+        project["videos"].append(video_entry)
+        self._video_index.setdefault(scene_folder, video_entry)
+        return video_entry
+
+    def update_video_status(self, tracking_data, scene_folder, status, output_file=None, error_message=None, timestamp=None):
+        """Update status of a video in tracking (looked up across all projects)"""
+        self._index_tracking(tracking_data)
+        video = self._video_index.get(scene_folder)
+        if video is None:
+            return
+
+        video["status"] = status
+        if status == "downloaded":
+            video["downloaded_at"] = timestamp or datetime.now().isoformat()
+            video["output_file"] = output_file
+        if error_message:
+            video["error_message"] = error_message
+    
+    # ============================================
+    # CLI / USER INPUT FUNCTIONS
+    # ============================================
+    
+    def get_mode_selection(self):
+        """Prompt user to select operation mode"""
+        print("\n" + "="*60)
+        print("🎬 HEYGEN BATCH VIDEO AUTOMATION")
+        print("   (Persistent Context Mode)")
+        print("="*60 + "\n")
+        
+        print(f"📁 Profile: {self.profile_dir}")
+        print(f"🖥️ Mode: {'Headless' if self.headless else 'Visible'}")
+        print("")
+        
+        print("Select operation mode:")
+        print("  1. Submit new videos")
+        print("  2. Check & download pending videos")
+        print("  3. Submit & download (unattended overnight mode)")
+        print("")
+        
+        while True:
+            choice = input("👉 Enter your choice (1, 2, or 3): ").strip()
+            if choice == "1":
+                return "submit"
+            elif choice == "2":
+                return "download"
+            elif choice == "3":
+                return "unattended"
+            else:
+                print("❌ Invalid choice. Please enter 1, 2, or 3")
+
+    def _scan_subdirs(self, path):
+        """Return the sub-directories of path as DirEntry objects, sorted by name."""
+        with os.scandir(path) as entries:
+            subdirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+        subdirs.sort(key=lambda entry: entry.name)
+        return subdirs
+
+    def _find_scene_script(self, scene_path):
+        """Find the script file in a scene folder with a single directory scan.
+        Returns: (script_path, script_filename), or (None, None) if there is no script
+        """
+        txt_files = []
+        text_files = []
+        with os.scandir(scene_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".txt"):
+                    txt_files.append(entry)
+                elif entry.name.endswith(".text"):
+                    text_files.append(entry)
+
+        # .txt scripts take precedence over .text ones
+        candidates = sorted(txt_files, key=lambda entry: entry.name) or sorted(text_files, key=lambda entry: entry.name)
+        if not candidates:
+            return None, None
+        return candidates[0].path, candidates[0].name
+
+    def _scan_project_scenes(self, project_path):
+        """Scan a project folder's scenes.
+        Returns: list of (scene_folder_name, script_path, script_name); path and name are None without a script
+        """
+        return [
+            (scene.name, *self._find_scene_script(scene.path))
+            for scene in self._scan_subdirs(project_path)
+        ]
+
+    def get_project_info(self):
+        """
+        Scan inputFiles for Projects and their Scenes
+        Returns: (project_name, list of (scene_folder_name, script_path, script_filename))
+        """
+        try:
+            # Get all project folders (first level)
+            projects = self._scan_subdirs(self.input_files_dir)
+
+            if not projects:
+                raise Exception(f"No project folders found in {self.input_files_dir}")
+
+            # Display projects with their scenes
+            print("\n" + "="*60)
+            print("📂 AVAILABLE PROJECTS")
+            print("="*60 + "\n")
+
+            # Projects are independent, so scan them concurrently; this hides the
+            # per-directory latency when inputFiles lives on network storage.
+            with ThreadPoolExecutor(max_workers=min(8, len(projects))) as pool:
+                scanned_projects = list(pool.map(self._scan_project_scenes, [project.path for project in projects]))
+
+            project_info_list = [] # List of (project_name, scene_list)
+
+            for idx, (project, scenes) in enumerate(zip(projects, scanned_projects), 1):
+                print(f"  {idx}. {project.name}")
+
+                # Scenes with a script, built once here so selection needs no rescan
+                scene_list = [] # List of (scene_folder_name, script_path, script_filename)
+                for scene_name, script_path, script_name in scenes:
+                    if script_path:
+                        scene_list.append((scene_name, script_path, os.path.splitext(script_name)[0]))
+                        print(f"      └── {scene_name} ({script_name})")
+                    else:
+                        print(f"      └── {scene_name} (no script found)")
+                project_info_list.append((project.name, scene_list))
+                print("")
+        
+            # Get user selection (Multi-select)
+            selected_projects_data = [] # List of (project_name, scene_list)
+            
+            while True:
+                try:
+                    selection = input(f"👉 Select project (e.g. 1-3, '1,2', 'all'): ").strip().lower()
+                    
+                    indices = set()
+                    if selection in ['all', 'a']:
+                        indices = set(range(len(projects)))
+                    else:
+                        # Parse ranges and commas in a single regex pass
+                        for match in _SELECTION_RE.finditer(selection):
+                            start = int(match.group(1))
+                            end = int(match.group(2)) if match.group(2) else start
+                            indices.update(range(start-1, end))
+                    
+                    # Validate indices
+                    valid_indices = [i for i in indices if 0 <= i < len(projects)]
+                    
+                    if not valid_indices:
+                         print("❌ No valid projects selected.")
+                         continue
+                         
+                    print(f"✅ Selected {len(valid_indices)} project(s).")
+                    
+                    for idx in sorted(valid_indices):
+                        selected_project_name, scene_list = project_info_list[idx]
+
+                        if scene_list:
+                             selected_projects_data.append((selected_project_name, scene_list))
+                        else:
+                            print(f"⚠️ Skipping {selected_project_name} (no scripts found)")
+    
+                    if not selected_projects_data:
+                         print("❌ No valid scenes found in selected projects.")
+                         continue
+                         
+                    break
+    
+                except ValueError:
+                    print("❌ Invalid input format.")
+            
+            return selected_projects_data
+            
+        except Exception as e:
+            print(f"❌ Error reading project info: {e}")
+            raise
+    
+    def read_script_file(self, script_path, max_chars=None):
+        """Read the script content from file.
+        With max_chars, reads at most max_chars + 1 characters: enough for the
+        caller to tell the script was too long without loading the whole file.
+        """
         try:
             with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = f.read() if max_chars is None else f.read(max_chars + 1)
             return content
         except Exception as e:
             print(f"❌ Error reading script file: {e}")
             raise
 
-    def get_script_content(self, script_path, script_text):
+    def get_script_content(self, script_path, script_text, max_chars=None):
         """Return script text from memory or file path"""
         if script_text is not None:
             return script_text
-        return self.read_script_file(script_path)
-    
-    def get_user_preferences(self):
-        """Get user preferences for video generation via CLI prompts"""
-        print("\n" + "="*60)
-        print("🎬 VIDEO CONFIGURATION (applies to all videos)")
-        print("="*60 + "\n")
-        
-        # Get video quality
-        while True:
-            quality = input("📊 Select video quality (720p/1080p) [default: 720p]: ").strip().lower()
-            if quality == "":
-                quality = "720p"
-                break
-            elif quality in ["720p", "1080p"]:
-                break
-            else:
-                print("❌ Invalid choice. Please enter '720p' or '1080p'")
-        
-        # Get FPS
-        while True:
-            fps = input("🎥 Select FPS (25/30/60) [default: 25]: ").strip()
-            if fps == "":
-                fps = "25"
-                break
-            elif fps in ["25", "30", "60"]:
-                break
-            else:
-                print("❌ Invalid choice. Please enter 25, 30, or 60")
-        
-        # Get subtitle preference
-        while True:
-            subtitle = input("📝 Enable subtitles? (yes/no) [default: yes]: ").strip().lower()
-            if subtitle == "":
-                subtitle = "yes"
-                break
-            elif subtitle in ["yes", "y", "no", "n"]:
-                subtitle = "yes" if subtitle in ["yes", "y"] else "no"
-                break
-            else:
-                print("❌ Invalid choice. Please enter 'yes' or 'no'")
-        
-        print("\n" + "="*60)
-        print("✅ Configuration Complete!")
-        print(f"   Quality: {quality}")
-        print(f"   FPS: {fps}")
-        print(f"   Subtitles: {subtitle}")
-        print("="*60 + "\n")
-        
-        return {"quality": quality, "fps": fps, "subtitles": subtitle, "avatar_name": None}
-    
-    # ============================================
-    # BROWSER HELPER FUNCTIONS
-    # ============================================
-    
+        return self.read_script_file(script_path, max_chars=max_chars)
+    
+    def get_user_preferences(self):
+        """Get user preferences for video generation via CLI prompts"""
+        print("\n" + "="*60)
+        print("🎬 VIDEO CONFIGURATION (applies to all videos)")
+        print("="*60 + "\n")
+        
+        # Get video quality
+        while True:
+            quality = input("📊 Select video quality (720p/1080p) [default: 720p]: ").strip().lower()
+            if quality == "":
+                quality = "720p"
+                break
+            elif quality in ["720p", "1080p"]:
+                break
+            else:
+                print("❌ Invalid choice. Please enter '720p' or '1080p'")
+        
+        # Get FPS
+        while True:
+            fps = input("🎥 Select FPS (25/30/60) [default: 25]: ").strip()
+            if fps == "":
+                fps = "25"
+                break
+            elif fps in ["25", "30", "60"]:
+                break
+            else:
+                print("❌ Invalid choice. Please enter 25, 30, or 60")
+        
+        # Get subtitle preference
+        while True:
+            subtitle = input("📝 Enable subtitles? (yes/no) [default: yes]: ").strip().lower()
+            if subtitle == "":
+                subtitle = "yes"
+                break
+            elif subtitle in ["yes", "y", "no", "n"]:
+                subtitle = "yes" if subtitle in ["yes", "y"] else "no"
+                break
+            else:
+                print("❌ Invalid choice. Please enter 'yes' or 'no'")
+        
+        print("\n" + "="*60)
+        print("✅ Configuration Complete!")
+        print(f"   Quality: {quality}")
+        print(f"   FPS: {fps}")
+        print(f"   Subtitles: {subtitle}")
+        print("="*60 + "\n")
+        
+        return {"quality": quality, "fps": fps, "subtitles": subtitle, "avatar_name": None}
+    
+    # ============================================
+    # BROWSER HELPER FUNCTIONS
+    # ============================================
+    
     def wait_for_latest_download(self, directory):
         """Watch a directory until a completed download appears."""
         print(f"🔍 Monitoring {directory} for new files (no timeout)...")
         start_time = time.time()
+        # Names present before we started watching; only these need the mtime
+        # check, since a download may already have created its file.
+        existing_names = set(os.listdir(directory))
+
+        # With watchdog, wake on file system events instead of every 2s; the
+        # directory scan below still runs as the fallback check
+        observer = handler = None
+        if Observer is not None:
+            try:
+                handler = _DownloadDirHandler()
+                observer = Observer()
+                observer.schedule(handler, directory, recursive=False)
+                observer.start()
+            except Exception as e:
+                print(f"⚠️ Could not watch {directory}, polling instead: {e}")
+                observer = handler = None
+
+        try:
+            return self._poll_for_download(directory, start_time, existing_names, handler)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+    def _poll_for_download(self, directory, start_time, existing_names, handler):
+        """Scan directory until the newest new file is complete (see wait_for_latest_download)"""
+        previous = None  # (path, mtime, size) of the newest file on the last poll
+        previous_since = None  # When previous was first seen
 
         while True:
-            time.sleep(2)
-            files = [os.path.join(directory, f) for f in os.listdir(directory)]
-            if not files:
+            if handler is None:
+                time.sleep(2)
+            else:
+                handler.changed.wait(2)
+                handler.changed.clear()
+                # Chrome renames .crdownload to the final name once the file is complete
+                if handler.completed and os.path.exists(handler.completed):
+                    return handler.completed
+            latest = None
+            latest_stat = None
+            try:
+                # DirEntry caches its stat result: one stat per file per poll gives mtime and size
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        stat = entry.stat()
+                        if entry.name in existing_names and stat.st_mtime < start_time:
+                            continue
+                        if latest is None or stat.st_mtime > latest_stat.st_mtime:
+                            latest, latest_stat = entry, stat
+            except OSError:
                 continue
-
-            latest_file = max(files, key=os.path.getmtime)
-            
-            if latest_file.endswith('.crdownload') or latest_file.endswith('.tmp'):
-                print(f"⏳ File downloading: {os.path.basename(latest_file)}", end='\r')
-                continue
-                
-            try:
-                size1 = os.path.getsize(latest_file)
-                time.sleep(2)
-                size2 = os.path.getsize(latest_file)
-                
-                if size1 == size2 and size1 > 0:
-                    if os.path.getmtime(latest_file) >= start_time:
-                        return latest_file
-            except:
-                pass
-                
-        return None
-    
+
+            if latest is None:
+                continue
+
+            if latest.name.endswith(_PARTIAL_DOWNLOAD_SUFFIXES):
+                print(f"⏳ File downloading: {latest.name}", end='\r')
+                previous = None
+                continue
+
+            # The file is complete once its mtime and size stay the same for a while;
+            # with watchdog, polls can be milliseconds apart, so time it rather than count polls
+            current = (latest.path, latest_stat.st_mtime, latest_stat.st_size)
+            if current != previous:
+                previous, previous_since = current, time.monotonic()
+            elif (latest_stat.st_size > 0
+                    and time.monotonic() - previous_since >= _DOWNLOAD_STABLE_SECONDS):
+                return latest.path
+    
     def launch_browser(self, playwright):
         """Launch browser with persistent context"""
+        if self.cdp_url:
+            return self._connect_browser_over_cdp(playwright, self.cdp_url)
+
         print(f"\n🚀 Launching browser ({'headless' if self.headless else 'visible'} mode)...")
-        
-        # Check if profile exists
-        if not os.path.exists(self.profile_dir):
-            print("❌ Chrome profile not found!")
-            print(f"   Expected: {self.profile_dir}")
-            print("   Please run setup_profile.py first.")
-            return None
-        
+        
+        # Check if profile exists
+        if not os.path.exists(self.profile_dir):
+            print("❌ Chrome profile not found!")
+            print(f"   Expected: {self.profile_dir}")
+            print("   Please run setup_profile.py first.")
+            return None
+        
         browser_channel = os.getenv("HEYGEN_BROWSER_CHANNEL", "chrome").strip().lower()
         if browser_channel in {"", "chromium", "none"}:
             browser_channel = None
@@ -425,13 +958,68 @@ class HeyGenAutomation:
             else:
                 raise
 
+        # Fail fast on missing elements instead of Playwright's 30s default
+        context.set_default_timeout(DEFAULT_ACTION_TIMEOUT_MS)
+        context.set_default_navigation_timeout(DEFAULT_NAVIGATION_TIMEOUT_MS)
+
         self._grant_clipboard_permissions(context)
 
         self._install_rating_popup_watchdog(context)
         
         print("✅ Browser launched successfully!")
         return context
-    
+    
+    def _connect_browser_over_cdp(self, playwright, cdp_url):
+        """Attach to an already running Chrome (started with --remote-debugging-port)
+        and reuse its default context instead of launching a new browser.
+        """
+        print(f"\n🔌 Connecting to running Chrome at {cdp_url}...")
+        try:
+            browser = playwright.chromium.connect_over_cdp(cdp_url)
+        except Exception as e:
+            print(f"❌ Could not connect to Chrome: {e}")
+            print("   Start Chrome with --remote-debugging-port=9222 or unset HEYGEN_CDP_URL.")
+            return None
+
+        context = browser.contexts[0] if browser.contexts else browser.new_context()
+
+        # downloads_path only applies to launched browsers; point Chrome at outputFiles directly
+        try:
+            cdp = browser.new_browser_cdp_session()
+            cdp.send("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": self.output_files_dir,
+            })
+        except Exception as e:
+            print(f"⚠️ Could not set download folder: {e}")
+
+        context.set_default_timeout(DEFAULT_ACTION_TIMEOUT_MS)
+        context.set_default_navigation_timeout(DEFAULT_NAVIGATION_TIMEOUT_MS)
+        self._grant_clipboard_permissions(context)
+        self._install_rating_popup_watchdog(context)
+
+        print("✅ Connected to Chrome!")
+        return context
+
+    def _open_heygen_home(self, page):
+        """Load the HeyGen homepage and wait until its Projects menu is usable"""
+        # Return once the response commits; the Projects menu wait below is the real readiness check
+        page.goto("https://www.heygen.com/", wait_until="commit")
+        self._locators.clear()
+        try:
+            page.locator('[data-testid="projects-menu"]').wait_for(state="visible", timeout=15000)
+        except PlaywrightTimeoutError:
+            print("⚠️ HeyGen homepage is slow to load; continuing anyway")
+
+    def _ensure_on_heygen(self, page):
+        """Open the HeyGen homepage unless the page already shows the app (a pooled
+        context from an earlier mode, or an attached browser)
+        """
+        if "heygen.com" in page.url and page.locator('[data-testid="projects-menu"]').is_visible():
+            return
+        print("🌐 Navigating to HeyGen...")
+        self._open_heygen_home(page)
+
     def _get_or_create_page(self, context):
         """Get existing page or create a new one"""
         if len(context.pages) > 0:
@@ -439,39 +1027,94 @@ class HeyGenAutomation:
         else:
             return context.new_page()
 
+    @contextmanager
+    def _browser_session(self, activity):
+        """Yield a page on HeyGen from a pooled browser context for one run_* mode,
+        or None if the browser or HeyGen could not be opened. Ctrl+C and errors end
+        the mode with a message; pending tracking is flushed and the context goes back
+        to the pool.
+        """
+        self._prepare_worker_profiles(self.submission_concurrency - 1)
+        context = self._browser_pool.acquire()
+        if not context:
+            yield None
+            return
+
+        try:
+            # Setup failures are reported here; the generator must still yield once
+            try:
+                page = self._get_or_create_page(context)
+                self._ensure_on_heygen(page)
+            except (KeyboardInterrupt, Exception) as e:
+                self._report_mode_error(activity, e)
+                page = None
+
+            try:
+                yield page
+            except (KeyboardInterrupt, Exception) as e:
+                self._report_mode_error(activity, e)
+        finally:
+            self.flush_tracking()
+            self._browser_pool.release(context)
+
+    @staticmethod
+    def _report_mode_error(activity, error):
+        """Print why a run_* mode stopped"""
+        if isinstance(error, KeyboardInterrupt):
+            print("\n\n⚠️ Stopped by user (Ctrl+C)")
+        else:
+            print(f"\n❌ Error during {activity}: {error}")
+            traceback.print_exc()
+
     def _install_rating_popup_watchdog(self, context):
-        """Auto-dismiss the rating popup whenever it appears"""
+        """Auto-dismiss the rating popup whenever it appears, and keep the
+        floating help widgets from intercepting clicks.
+        """
         script = """
         (() => {
-          const textNeedle = "How likely are you to recommend us";
-          const buttonLabels = ["Not now", "No thanks", "Skip"];
-          const closeLabels = ["Close", "Done", "OK", "Continue"];
+          const neutralizeWidgets = () => {
+            const style = document.createElement("style");
+            style.textContent = 'div[id^="x-gist-"], iframe.gist-frame { pointer-events: none !important; }'
+              + ' iframe.gist-frame { display: none !important; }';
+            document.documentElement.appendChild(style);
+          };
+          const dismissDialog = __DISMISS_DIALOG_JS__;
+          const options = {
+            labels: ["Not now", "No thanks", "Skip", "Close", "Done", "OK", "Continue"],
+            textNeedle: "How likely are you to recommend us",
+          };
+          const dialogSelector = 'div[role="dialog"], div.tw-stack-dialog, div.rc-dialog-wrap';
           const tryDismiss = () => {
-            const dialogs = document.querySelectorAll('div[role="dialog"], div.tw-stack-dialog, div.rc-dialog-wrap');
-            for (const dialog of dialogs) {
-              const text = dialog.innerText || "";
-              if (!text.includes(textNeedle)) {
-                continue;
-              }
-              const buttons = Array.from(dialog.querySelectorAll("button"));
-              const target = buttons.find((btn) => {
-                const label = (btn.getAttribute("aria-label") || "").toLowerCase();
-                if (label.includes("close")) {
-                  return true;
+            const result = dismissDialog(options);
+            return Boolean(result && result.dismissed);
+          };
+          // React to DOM changes instead of polling, so an idle page costs nothing
+          const touchesDialog = (node) => node.nodeType === 1 && (
+            node.matches(dialogSelector) || node.querySelector(dialogSelector) || node.closest(dialogSelector)
+          );
+          const observer = new MutationObserver((mutations) => {
+            for (const mutation of mutations) {
+              for (const node of mutation.addedNodes) {
+                if (touchesDialog(node)) {
+                  tryDismiss();
+                  return;
                 }
-                const btnText = (btn.innerText || "").trim();
-                return buttonLabels.includes(btnText) || closeLabels.includes(btnText);
-              });
-              if (target) {
-                target.click();
-                return true;
               }
             }
-            return false;
-          };
-          setInterval(tryDismiss, 1200);
+          });
+          observer.observe(document, { childList: true, subtree: true });
+          // Catch a popup that is already on the page
+          if (document.readyState === "loading") {
+            document.addEventListener("DOMContentLoaded", () => {
+              neutralizeWidgets();
+              tryDismiss();
+            }, { once: true });
+          } else {
+            neutralizeWidgets();
+            tryDismiss();
+          }
         })();
-        """
+        """.replace("__DISMISS_DIALOG_JS__", _DISMISS_DIALOG_JS)
         try:
             context.add_init_script(script)
         except Exception as e:
@@ -488,14 +1131,26 @@ class HeyGenAutomation:
                 context.grant_permissions(["clipboard-read", "clipboard-write"], origin=origin)
             except Exception as e:
                 print(f"⚠️ Could not grant clipboard permissions for {origin}: {e}")
-    
-    # ============================================
-    # SHARED HELPER METHODS (EXTRACTED FROM DUPLICATES)
-    # ============================================
-    
-    def _sanitize_filename(self, filename):
+    
+    # ============================================
+    # SHARED HELPER METHODS (EXTRACTED FROM DUPLICATES)
+    # ============================================
+    
+    @staticmethod
+    def _sanitize_filename(filename):
         """Sanitize filename for Windows (replace invalid chars)"""
-        return filename.replace('/', '-').replace(':', '-').replace('\\', '-').replace('|', '-')
+        return filename.translate(_SANITIZE_TABLE)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_avatar_pattern(avatar_name):
+        """Compile a case-insensitive pattern matching avatar_name literally."""
+        return re.compile(re.escape(avatar_name), re.IGNORECASE)
+
+    def _avatar_card_locator(self, page, avatar_name):
+        """Locate avatar cards containing avatar_name (case-insensitive)."""
+        pattern = self._compile_avatar_pattern(avatar_name)
+        return page.locator(AVATAR_CARD_SELECTOR).filter(has_text=pattern)
 
     def _dismiss_modal_overlays(self, page, timeout_seconds=4):
         """Dismiss blocking overlays such as rating popups or modal backdrops."""
@@ -529,74 +1184,51 @@ class HeyGenAutomation:
         except Exception:
             pass
 
-        overlay_selectors = [
-            "div.tw-stack-dialog",
-            "div.rc-dialog-wrap",
-            '[role="dialog"]',
-        ]
         button_labels = ["Close", "Done", "OK", "Continue", "Not now", "No thanks", "Skip", "Cancel"]
 
         deadline = time.time() + timeout_seconds
         while time.time() < deadline:
-            for selector in overlay_selectors:
+            # One round-trip per poll: find and click the dismiss button in the page
+            try:
+                result = page.evaluate(_DISMISS_DIALOG_JS, {"labels": button_labels, "textNeedle": None})
+            except Exception:
+                result = None
+
+            if result:
+                if result.get("dismissed"):
+                    time.sleep(0.4)
+                    return True
+                # fallback: click backdrop to dismiss
                 try:
-                    overlays = page.locator(selector)
-                    count = overlays.count()
-                    if count == 0:
-                        continue
-                    for i in range(min(count, 3)):
-                        overlay = overlays.nth(i)
-                        if not overlay.is_visible():
-                            continue
-                        for label in button_labels:
-                            btn = overlay.locator(f'button:has-text("{label}")')
-                            if btn.count() > 0 and btn.first.is_visible():
-                                btn.first.click()
-                                time.sleep(0.4)
-                                return True
-                        # fallback: click backdrop to dismiss
-                        try:
-                            overlay.click(position={"x": 10, "y": 10})
-                            time.sleep(0.2)
-                            return True
-                        except Exception:
-                            pass
+                    page.mouse.click(result["backdrop"]["x"], result["backdrop"]["y"])
+                    time.sleep(0.2)
+                    return True
                 except Exception:
-                    continue
+                    pass
             time.sleep(0.3)
         return False
-    
-    def _smart_truncate(self, text, limit=25000):
-        """
-        Truncate text to limit, but cut off at the last complete sentence.
-        Returns the truncated text.
-        """
-        if len(text) <= limit:
-            return text
-            
-        print(f"⚠️ Script exceeds {limit} characters (Total: {len(text)}). Truncating...")
-        
-        # Slice to the limit
-        truncated = text[:limit]
-        
-        # List of sentence-ending punctuation
-        # We look for the last occurrence of any of these
-        endings = ['.', '!', '?', '\n']
-        
-        last_end = -1
-        for char in endings:
-            pos = truncated.rfind(char)
-            if pos > last_end:
-                last_end = pos
-        
-        if last_end != -1:
-            # Cut at the punctuation (include it)
-            final_text = truncated[:last_end+1]
-        else:
-            # Fallback if no sentence ending found (rare for 25k chars)
-            final_text = truncated
-            
-        print(f"✂️  Truncated to {len(final_text)} characters (removed {len(text) - len(final_text)} chars)")
+    
+    def _smart_truncate(self, text, limit=SCRIPT_CHAR_LIMIT):
+        """
+        Truncate text to limit, but cut off at the last complete sentence.
+        Returns the truncated text.
+        """
+        if len(text) <= limit:
+            return text
+            
+        print(f"⚠️ Script exceeds {limit} characters. Truncating...")
+        
+        # Find the last sentence-ending punctuation within the limit
+        match = _SENTENCE_END_RE.match(text, 0, limit)
+
+        if match:
+            # Cut at the punctuation (include it)
+            final_text = text[:match.end()]
+        else:
+            # Fallback if no sentence ending found (rare for 25k chars)
+            final_text = text[:limit]
+            
+        print(f"✂️  Truncated to {len(final_text)} characters")
         return final_text
 
     def _dismiss_rating_popup(self, page):
@@ -648,34 +1280,146 @@ class HeyGenAutomation:
             'div[contenteditable="true"]',
         ]
 
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            for selector in selectors:
-                try:
-                    locator = page.locator(selector)
-                    if locator.count() > 0 and locator.first.is_visible():
-                        return True
-                except Exception:
-                    pass
-            time.sleep(0.4)
-        return False
+        editor = self._union_locator(page, selectors).filter(visible=True).first
+        try:
+            editor.wait_for(state="visible", timeout=timeout_seconds * 1000)
+            return True
+        except Exception:
+            return False
 
     def _wait_for_script_editor(self, page, timeout_seconds=8):
         """Wait for the script editor to appear (new UI or AI Studio)."""
         return self._wait_for_ai_studio_editor(page, timeout_seconds=timeout_seconds)
 
+    def _cached_locator(self, page, key, selector):
+        """Return a memoized Locator for a static selector on the given page.
+        Locators are lazy, so a cached one stays valid across DOM updates.
+        """
+        if self._locator_page is not page:
+            self._locators.clear()
+            self._locator_page = page
+        locator = self._locators.get(key)
+        if locator is None:
+            locator = self._locators[key] = page.locator(selector)
+        return locator
+
+    def _set_combobox(self, page, label, value):
+        """Pick an option in a labelled Generate-modal combobox with one evaluate call.
+        Returns: the _SET_COMBOBOX_JS status, or "missing" if the call failed
+        """
+        try:
+            return page.evaluate(_SET_COMBOBOX_JS, {"label": label, "value": value})
+        except Exception as e:
+            print(f"⚠️ Could not set {label} directly: {e}")
+            return "missing"
+
+    def _select_combobox_option(self, page, label, value, trigger):
+        """Set a labelled Generate-modal combobox to value, falling back to clicking the
+        trigger locator when the field can't be found by its label. A failure is reported, not raised.
+        Returns: True if the combobox shows value afterwards
+        """
+        status = self._set_combobox(page, label, value)
+        if status == "no-option":
+            print(f"⚠️ No {label} option '{value}'; leaving it unchanged")
+            return False
+        if status == "missing":
+            options = page.locator('[data-item-label="true"]')
+            try:
+                trigger.click()
+                self._wait_dom_settled(page, '[data-item-label="true"]')
+                options.filter(has_text=value).first.click()
+            except Exception as e:
+                print(f"⚠️ Could not set {label}: {e}")
+                # Close a dropdown left open so it doesn't cover the rest of the modal
+                if options.first.is_visible():
+                    page.keyboard.press("Escape")
+        self._wait_dom_settled(page, '[data-item-label="true"]', state="hidden")
+
+        if status == "picked":
+            return True
+        try:
+            shown = page.evaluate(_COMBOBOX_TEXT_JS, label)
+        except Exception:
+            shown = None
+        if shown is None or value not in shown:
+            print(f"⚠️ Could not confirm {label} is set to '{value}' (shows {shown!r})")
+            return False
+        return True
+
+    def _wait_dom_settled(self, page, selector, timeout=2000, state="visible", fallback_seconds=1):
+        """Wait for the element the next step needs instead of a fixed sleep.
+        Falls back to sleeping fallback_seconds if it doesn't reach state in time.
+        Returns: True if the element reached the state, False otherwise
+        """
+        try:
+            page.locator(selector).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            time.sleep(fallback_seconds)
+            return False
+
+    def _wait_for_editor_text(self, page, min_length=1, timeout=8000, fallback_seconds=2):
+        """Wait until the script editor holds at least min_length characters (e.g. after a paste).
+        min_length=0 waits for the editor to be empty instead.
+        """
+        try:
+            page.wait_for_function(
+                _EDITOR_TEXT_LENGTH_JS,
+                arg={"selector": 'span[data-node-view-content]', "minLength": min_length},
+                timeout=timeout,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            time.sleep(fallback_seconds)
+            return False
+
+    def _clear_editor(self, page):
+        """Empty the focused script editor"""
+        page.keyboard.press(self._select_all_key)
+        page.keyboard.press("Delete")
+        self._wait_for_editor_text(page, min_length=0, timeout=1500, fallback_seconds=0.2)
+
+    def _script_landed(self, page, min_length, max_length):
+        """Wait for a paste to fill the script editor.
+        Returns: True if it holds between min_length and max_length characters; an
+        over-long result (an earlier paste landing late) is cleared and returns False
+        """
+        if not self._wait_for_editor_text(page, min_length=min_length):
+            return False
+        length = page.evaluate(_EDITOR_TEXT_COUNT_JS, 'span[data-node-view-content]')
+        if length <= max_length:
+            return True
+        print(f"⚠️ Editor holds {length} characters, more than the script; clearing it")
+        self._clear_editor(page)
+        return False
+
+    def _union_locator(self, page, selectors):
+        """Combine selectors into a single locator matching any of them."""
+        union = page.locator(selectors[0])
+        for selector in selectors[1:]:
+            union = union.or_(page.locator(selector))
+        return union
+
     def _click_first_visible(self, page, selectors, timeout_seconds=8):
         """Click the first visible selector in the list within the timeout."""
         deadline = time.time() + timeout_seconds
         last_error = None
+        any_visible = self._union_locator(page, selectors).filter(visible=True).first
+        candidates = [(selector, page.locator(selector).first) for selector in selectors]
 
-        while time.time() < deadline:
-            for selector in selectors:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            # Wait in the browser for any candidate instead of polling each selector
+            try:
+                any_visible.wait_for(state="visible", timeout=remaining * 1000)
+            except Exception:
+                break
+
+            # Keep list order as the preference when several are visible
+            for selector, target in candidates:
                 try:
-                    locator = page.locator(selector)
-                    if locator.count() == 0:
-                        continue
-                    target = locator.first
                     if not target.is_visible():
                         continue
                     target.scroll_into_view_if_needed()
@@ -757,12 +1501,7 @@ class HeyGenAutomation:
 
         card = None
         if avatar_name:
-            xpath_selector = (
-                f'//div[contains(@class, "tw-rounded-[20px]") and '
-                f'.//text()[contains(translate(., "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), '
-                f'"{avatar_name.lower()}")]]'
-            )
-            card = page.locator(xpath_selector).first
+            card = self._avatar_card_locator(page, avatar_name).filter(visible=True).first
             if card.count() > 0:
                 try:
                     card.scroll_into_view_if_needed()
@@ -821,37 +1560,37 @@ class HeyGenAutomation:
         return False
 
     def _create_heygen_folder(self, page, heygen_folder_name):
-        """Create a new folder on HeyGen (shared helper)"""
+        """Create a new folder on HeyGen (shared helper)
+        Returns: True on success, False on failure
+        """
         print("📁 Creating project folder on HeyGen...")
         self._dismiss_rating_popup(page)
         
-        page.locator('[data-testid="projects-menu"]').click()
-        time.sleep(2)
-        
-        page.locator('//button[@title="New Folder"]').click()
-        time.sleep(1)
-        
-        page.locator('//input[@placeholder="Enter folder name"]').fill(heygen_folder_name)
-        time.sleep(1)
-        
-        page.locator('//button[normalize-space()="Save"]').click()
-        time.sleep(2)
-        print(f"✅ Folder created: '{heygen_folder_name}'")
-    
-    
+        try:
+            page.locator('[data-testid="projects-menu"]').click(timeout=SERVER_ACTION_TIMEOUT_MS)
+            time.sleep(2)
+            
+            page.locator('//button[@title="New Folder"]').click(timeout=SERVER_ACTION_TIMEOUT_MS)
+            time.sleep(1)
+            
+            page.locator('//input[@placeholder="Enter folder name"]').fill(heygen_folder_name, timeout=SERVER_ACTION_TIMEOUT_MS)
+            time.sleep(1)
+            
+            page.locator('//button[normalize-space()="Save"]').click(timeout=SERVER_ACTION_TIMEOUT_MS)
+            time.sleep(2)
+        except Exception as e:
+            print(f"❌ Could not create folder '{heygen_folder_name}': {e}")
+            return False
+        print(f"✅ Folder created: '{heygen_folder_name}'")
+        return True
+    
+    
     def _find_and_select_avatar(self, page, avatar_name_to_find):
         """Find avatar by name, scrolling if necessary"""
         print(f"🔍 Searching for avatar: '{avatar_name_to_find}'...")
 
         def open_avatar_menu():
-            selectors = [
-                '[data-testid="my-avatars-menu"]',
-                'button:has-text("My avatars")',
-                'button:has-text("My Avatars")',
-                'a:has-text("Avatars")',
-                'button:has-text("Avatars")',
-            ]
-            for selector in selectors:
+            for selector in AVATAR_MENU_SELECTORS:
                 try:
                     locator = page.locator(selector).first
                     locator.wait_for(state="visible", timeout=5000)
@@ -874,1001 +1613,1052 @@ class HeyGenAutomation:
                 print("⚠️ Could not open avatar menu.")
                 return False
         
-        # Try to find exactly matching text first
+        # Cards are matched by a case-insensitive name pattern and filtered to visible
+        # ones inside the browser, so picking a card is a single round-trip
+        card = self._avatar_card_locator(page, avatar_name_to_find).filter(visible=True).first
         start_time = time.time()
         timeout = 30 # Search for up to 30 seconds
-        found = False
-        
-        while time.time() - start_time < timeout:
-            # Look for ANY element containing the name
-            # We use a broad selector to catch the name on the card
-            try:
-                # Use XPath to find the specific card containing the text. 
-                # We look for the card container class 'tw-rounded-[20px]' that HAS the text somewhere inside it.
-                # This ensures we get the CLICKABLE card element, not just a random text span.
-                xpath_selector = f'//div[contains(@class, "tw-rounded-[20px]") and .//text()[contains(translate(., "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{avatar_name_to_find.lower()}")]]'
-                
-                elements = page.locator(xpath_selector)
-                
-                count = elements.count()
-                if count > 0:
-                     # Check if any are visible
-                     for i in range(count):
-                         if elements.nth(i).is_visible():
-                             print(f"   ✅ Found avatar '{avatar_name_to_find}'")
-                             # Robust click sequence
-                         card = elements.nth(i)
-                         card.scroll_into_view_if_needed()
-                         card.hover()
-                         time.sleep(1)
-                         try:
-                             card.click(timeout=2000) # Short timeout for standard click
-                         except Exception as e_click:
-                             print(f"      ⚠️ Standard click failed: {e_click}")
-                             try:
-                                 print("      🔨 Trying force click...")
-                                 card.click(force=True, timeout=2000)
-                             except Exception as e_force:
-                                 print(f"      ⚠️ Force click failed: {e_force}")
-                                 print("      🧬 Trying JS dispatch click...")
-                                 card.dispatch_event('click')
-
-                         # New UI: confirm avatar selection via dialog
-                         self._confirm_avatar_use_in_video(page)
-                         return True
-            except Exception as e_outer:
-                # Only print if it's not a common "element not found" type error during iteration
-                # print(f"   ⚠️ Search iteration error: {e_outer}")
-                pass
-                
-            # Not found yet, scroll down
-            print("   ⏬ Scrolling down...", end='\r')
-            page.mouse.wheel(0, 1000)
-            time.sleep(1)
-            
+
+        while time.time() - start_time < timeout:
+            try:
+                # click() itself waits for the card, scrolls it into view and hovers it
+                card.click(timeout=1000)
+                print(f"   ✅ Found avatar '{avatar_name_to_find}'")
+            except PlaywrightTimeoutError as e_click:
+                if not card.is_visible():
+                    # Not found yet, scroll down; the next click attempt gives the list time to load
+                    print("   ⏬ Scrolling down...", end='\r')
+                    page.mouse.wheel(0, 1000)
+                    continue
+
+                print(f"   ✅ Found avatar '{avatar_name_to_find}'")
+                print(f"      ⚠️ Standard click failed: {e_click}")
+                try:
+                    # The click may have landed anyway and swapped the grid out
+                    card.wait_for(state="detached", timeout=1500)
+                except PlaywrightTimeoutError:
+                    try:
+                        print("      🔨 Trying force click...")
+                        card.click(force=True, timeout=2000)
+                    except Exception as e_force:
+                        print(f"      ⚠️ Force click failed: {e_force}")
+                        print("      🧬 Trying JS dispatch click...")
+                        try:
+                            card.dispatch_event('click')
+                        except Exception:
+                            # The card went away mid-click (e.g. list re-rendered); search again
+                            continue
+            except Exception:
+                # The card went away mid-click (e.g. list re-rendered); search again
+                continue
+
+            # New UI: confirm avatar selection via dialog
+            self._confirm_avatar_use_in_video(page)
+            return True
+
         print(f"⚠️ Could not find avatar '{avatar_name_to_find}' after scrolling.")
         return False
 
     def _confirm_avatar_use_in_video(self, page):
         """Click the 'Use in video' dialog button if it appears after avatar selection."""
         dialog = page.locator("div.rc-dialog-wrap")
-        button_selectors = [
-            'button:has-text("Use in video")',
-            'button:has-text("Use this avatar")',
-            'button:has-text("Use avatar")',
-        ]
+        target = dialog.locator(USE_AVATAR_BUTTON_SELECTOR).first
+
+        try:
+            expect(target).to_be_visible(timeout=6000)
+            target.click()
+        except Exception:
+            # Dialog never showed up (or went away before the click)
+            return False
+        try:
+            expect(dialog.first).to_be_hidden(timeout=4000)
+        except AssertionError:
+            pass
+        return True
 
-        deadline = time.time() + 6
-        while time.time() < deadline:
-            try:
-                if dialog.count() > 0 and dialog.first.is_visible():
-                    for selector in button_selectors:
-                        target = dialog.locator(selector)
-                        if target.count() > 0 and target.first.is_visible():
-                            target.first.click()
-                            time.sleep(0.6)
-                            try:
-                                dialog.first.wait_for(state="hidden", timeout=4000)
-                            except Exception:
-                                pass
-                            return True
-            except Exception:
-                pass
-            time.sleep(0.4)
-        return False
-
     def _submit_single_video(self, page, scene_folder, script_path, script_filename, config, heygen_folder_name, avatar_name, tracking_data, project_name, script_text=None):
         """Submit a single video to HeyGen (shared helper)
         Returns: True on success, False on failure
         """
-        # Read script
-        video_script = self.get_script_content(script_path, script_text)
-        
-        # Smart truncate if needed
-        video_script = self._smart_truncate(video_script, limit=25000)
-        
-        print(f"📄 Script loaded: {len(video_script)} characters")
-        
-        # Select Avatar (Smart Search)
-        print("👤 Opening avatar section...")
-        if not self._find_and_select_avatar(page, avatar_name):
-             print(f"❌ Failed to select avatar '{avatar_name}'. Skipping video.")
-             return False
-        
-        time.sleep(2)
+        # Read script (files are read only as far as the truncation limit needs)
+        video_script = self.get_script_content(script_path, script_text, max_chars=SCRIPT_CHAR_LIMIT)
+        
+        # Smart truncate if needed
+        video_script = self._smart_truncate(video_script, limit=SCRIPT_CHAR_LIMIT)
+        
+        print(f"📄 Script loaded: {len(video_script)} characters")
+        
+        # Select Avatar (Smart Search)
+        print("👤 Opening avatar section...")
+        if not self._find_and_select_avatar(page, avatar_name):
+             print(f"❌ Failed to select avatar '{avatar_name}'. Skipping video.")
+             return False
+        
+        # Either the editor or the "Use in video" action shows up next
+        self._wait_dom_settled(
+            page, 'span[data-node-view-content], div[contenteditable="true"], button:has-text("Use in video")',
+            timeout=3000, fallback_seconds=2
+        )
         print("✅ Avatar selected")
         
         # Open the standard video editor (new UI flow)
         print("🎬 Opening video editor...")
-        self._dismiss_modal_overlays(page)
         if not self._open_video_editor(page, avatar_name):
             print("❌ Could not open video editor. UI may have changed.")
             return False
         print("✅ Video editor opened")
-        
-        # Add Script using clipboard paste (ProseMirror requires this)
-        print("📝 Adding script...")
-        try:
-            page.locator('text=Type your script or').click()
-        except:
-            page.locator('span[data-node-view-content]').first.click()
-        
-        time.sleep(0.5)
-        
-        # Select any existing content first
-        modifier_key = "Meta" if sys.platform == "darwin" else "Control"
-        page.keyboard.press(f"{modifier_key}+a")
-        time.sleep(0.2)
+        
+        # Add Script using clipboard paste (ProseMirror requires this)
+        print("📝 Adding script...")
+        try:
+            self._cached_locator(page, 'script_placeholder', 'text=Type your script or').click()
+        except:
+            self._cached_locator(page, 'script_editor', 'span[data-node-view-content]').first.click()
+        
+        self._wait_dom_settled(page, 'div[contenteditable="true"]:focus', timeout=1000, fallback_seconds=0.5)
+        
+        # Clear any existing content first so a single paste can be verified by length
+        self._clear_editor(page)
+        # Some whitespace (paragraph breaks) doesn't survive into innerText;
+        # anything well past the script's length means it went in twice
+        expected_length = max(1, int(len(video_script) * 0.9))
+        max_length = len(video_script) * 3 // 2
         
         # Copy script to clipboard and paste it (ProseMirror handles paste events properly)
         paste_ok = False
         try:
+            # evaluate() resolves once the clipboard write promise has settled
             page.evaluate("""(text) => navigator.clipboard.writeText(text)""", video_script)
-            time.sleep(0.3)
 
             # Paste the script - this triggers ProseMirror's paste handler
-            page.keyboard.press(f"{modifier_key}+v")
-            time.sleep(2)  # Give extra time for large scripts (20k+ words)
-            paste_ok = True
+            page.keyboard.press(self._paste_key)
+            paste_ok = self._script_landed(page, expected_length, max_length)
         except Exception as e:
             print(f"⚠️ Clipboard paste failed: {e}")
 
         if not paste_ok and sys.platform != "darwin":
             try:
+                # Drop any partial paste so the fallback starts from an empty editor
+                self._clear_editor(page)
                 page.keyboard.press("Shift+Insert")
-                time.sleep(2)
-                paste_ok = True
+                paste_ok = self._script_landed(page, expected_length, max_length)
             except Exception as e:
                 print(f"⚠️ Windows paste fallback failed: {e}")
 
         if not paste_ok:
+            # insert_text sends the whole script as a single CDP Input.insertText call
             print("⌨️ Falling back to direct text insert...")
+            self._clear_editor(page)
             page.keyboard.insert_text(video_script)
-            time.sleep(2)
-        
-        print(f"✅ Script added ({len(video_script)} characters)")
-        
+            if not self._script_landed(page, expected_length, max_length):
+                print("❌ Could not add the script to the editor.")
+                return False
+        
+        print(f"✅ Script added ({len(video_script)} characters)")
+        
         # Name the video with timestamp + scene folder name
-        current_datetime = datetime.now().strftime("%m/%d/%Y %I:%M %p")
+        submitted_at = datetime.now()
+        current_datetime = submitted_at.strftime("%m/%d/%Y %I:%M %p")
         video_name = f"{current_datetime} {scene_folder}"
         
-        page.locator('//input[@placeholder="Untitled Video"]').fill(video_name)
+        self._cached_locator(page, 'video_name', '//input[@placeholder="Untitled Video"]').fill(video_name)
         print(f"🏷️ Video named: '{video_name}'")
 
         # Ensure 16:9 aspect ratio in the new editor
         try:
-            ratio_btn = page.locator('button:has-text("16:9")').first
+            ratio_btn = self._cached_locator(page, 'ratio_16_9', 'button:has-text("16:9")').first
             if ratio_btn.count() > 0 and ratio_btn.is_visible():
                 ratio_btn.click()
                 time.sleep(0.4)
                 print("✅ Aspect ratio set to 16:9")
         except Exception:
             pass
-        
-        # Select "Apollo" / Engine 4.0 - Unlimited option
-        print("🔄 Checking Avatar Engine (Unlimited)...")
-        try:
-            # 1. Click the engine dropdown button (using user-provided selector)
-            # The button usually shows "Avatar IV" or similar
-            engine_dropdown = page.locator('button.hover\\:tw-bg-fill-blockHover:has(span.tw-text-textTitle:text-matches("Avatar", "i"))')
-            
-            # If the specific button selector from user is needed more precisely:
-            if engine_dropdown.count() == 0:
-                 # Fallback to broader selector if "Avatar IV" text changes (e.g. "Instant Avatar")
-                 engine_dropdown = page.locator('button:has(img[alt*="Avatar"])')
-            
-            if engine_dropdown.count() > 0 and engine_dropdown.first.is_visible():
-                engine_dropdown.first.click()
-                time.sleep(1)
-                
-                # 2. Select "Unlimited" from the dropdown (using user-provided selector)
-                # Look for the menu item containing "Unlimited" text and checkmark icon
-                unlimited_option = page.locator('div[role="menuitem"]:has-text("Unlimited")')
-                
-                if unlimited_option.count() > 0:
-                    # Check if it is already selected (it might have a visible checkmark or special class)
-                    # The user's HTML shows a checkmark icon inside the div if selected
-                    # <iconpark-icon class="iconpark-icon tw-text-more-grass" name="checkmark" ...>
-                    
-                    # We can click it anyway; usually clicking an already selected option does nothing or stays selected.
-                    # But let's see if we can detect it.
-                    
-                    unlimited_option.first.click()
-                    time.sleep(1)
-                    print("✅ Selected 'Unlimited' engine")
-                else:
-                    print("ℹ️ 'Unlimited' option not found in dropdown")
-                    # Click away to close dropdown
-                    page.mouse.click(0, 0)
-            else:
-                 print("ℹ️ Engine dropdown not found, skipping...")
-                 
-        except Exception as e:
-            print(f"⚠️ Could not select Avatar Unlimited: {e}")
-        
-        # Enable subtitles if requested
-        if config["subtitles"] == "yes":
-            print("📝 Enabling subtitles...")
-            try:
-                page.locator('button:has(iconpark-icon[name="cc-captions"])').click()
-                time.sleep(1)
-                page.locator('div.tw-grid.tw-gap-4.tw-pt-4.tw-grid-cols-1 button').first.click()
-                time.sleep(1)
-                print("✅ Subtitle template selected")
-            except Exception as e:
-                print(f"⚠️ Could not enable subtitles: {e}")
-        
+        
+        # Select "Apollo" / Engine 4.0 - Unlimited option
+        print("🔄 Checking Avatar Engine (Unlimited)...")
+        try:
+            # 1. Click the engine dropdown button (using user-provided selector)
+            # The button usually shows "Avatar IV" or similar
+            engine_dropdown = self._cached_locator(page, 'engine_dropdown', 'button.hover\\:tw-bg-fill-blockHover:has(span.tw-text-textTitle:text-matches("Avatar", "i"))')
+            
+            # If the specific button selector from user is needed more precisely:
+            if engine_dropdown.count() == 0:
+                 # Fallback to broader selector if "Avatar IV" text changes (e.g. "Instant Avatar")
+                 engine_dropdown = self._cached_locator(page, 'engine_dropdown_fallback', 'button:has(img[alt*="Avatar"])')
+            
+            if engine_dropdown.count() > 0 and engine_dropdown.first.is_visible():
+                engine_dropdown.first.click()
+                self._wait_dom_settled(page, 'div[role="menuitem"]:has-text("Unlimited")')
+                
+                # 2. Select "Unlimited" from the dropdown (using user-provided selector)
+                # Look for the menu item containing "Unlimited" text and checkmark icon
+                unlimited_option = self._cached_locator(page, 'engine_unlimited', 'div[role="menuitem"]:has-text("Unlimited")')
+                
+                if unlimited_option.count() > 0:
+                    # Check if it is already selected (it might have a visible checkmark or special class)
+                    # The user's HTML shows a checkmark icon inside the div if selected
+                    # <iconpark-icon class="iconpark-icon tw-text-more-grass" name="checkmark" ...>
+                    
+                    # We can click it anyway; usually clicking an already selected option does nothing or stays selected.
+                    # But let's see if we can detect it.
+                    
+                    unlimited_option.first.click()
+                    self._wait_dom_settled(page, 'div[role="menuitem"]', state="hidden")
+                    print("✅ Selected 'Unlimited' engine")
+                else:
+                    print("ℹ️ 'Unlimited' option not found in dropdown")
+                    # Click away to close dropdown
+                    page.mouse.click(0, 0)
+            else:
+                 print("ℹ️ Engine dropdown not found, skipping...")
+                 
+        except Exception as e:
+            print(f"⚠️ Could not select Avatar Unlimited: {e}")
+        
+        # Enable subtitles if requested
+        if config["subtitles"] == "yes":
+            print("📝 Enabling subtitles...")
+            try:
+                self._cached_locator(page, 'captions_button', 'button:has(iconpark-icon[name="cc-captions"])').click()
+                self._wait_dom_settled(page, 'div.tw-grid.tw-gap-4.tw-pt-4.tw-grid-cols-1 button')
+                self._cached_locator(page, 'subtitle_template', 'div.tw-grid.tw-gap-4.tw-pt-4.tw-grid-cols-1 button').first.click()
+                self._wait_dom_settled(page, 'button:has-text("Generate")')
+                print("✅ Subtitle template selected")
+            except Exception as e:
+                print(f"⚠️ Could not enable subtitles: {e}")
+        
         # Click Generate
         print("⚙️ Clicking Generate...")
-        self._dismiss_modal_overlays(page)
-        self._dismiss_rating_popup(page)
+        # Close any open editor popover (e.g. subtitle templates); popups are handled by the watchdog
+        page.keyboard.press("Escape")
         try:
-            generate_button = page.locator('button:has-text("Generate")')
-            
-            # Check if button is disabled
-            if generate_button.is_disabled():
-                print("\n" + "="*60)
-                print("❌ ERROR: Generate button is disabled!")
-                print("="*60)
-                print("\n⚠️ Possible reasons:")
-                print("   • Avatar doesn't have any audio/script assigned")
-                print("   • Script content is empty or invalid")
-                print("   • Please add audio to the avatar and run the code again.")
-                print("\n" + "="*60 + "\n")
-                return False
-            
-            generate_button.click()
-            page.wait_for_selector('text=Generate video', timeout=5000)
-            time.sleep(2)
-            print("✅ Generate modal opened")
-        except Exception as gen_error:
-            print("\n" + "="*60)
-            print("❌ ERROR: Could not open Generate modal!")
-            print("="*60)
-            print(f"\n⚠️ Error: {gen_error}")
-            print("\n⚠️ Possible reasons:")
-            print("   • Avatar doesn't have any audio/script assigned")
-            print("   • Script content is empty or invalid")
-            print("   • Please add audio to the avatar and run the code again.")
-            print("\n" + "="*60 + "\n")
-            return False
-        
-        # Set Resolution
-        print(f"🎥 Setting resolution to {config['quality']}...")
-        page.locator('text=Resolution').locator('..').locator('button[role="combobox"]').click()
-        time.sleep(1)
-        
-        if config['quality'] == "1080p":
-            page.locator('[data-item-label="true"]:has-text("1080p")').click()
-        else:
-            page.locator('[data-item-label="true"]:has-text("720p")').click()
-        time.sleep(1)
-        
-        # Set FPS
-        print(f"🎥 Setting FPS to {config['fps']}...")
-        page.locator('div.tw-flex.tw-flex-col.tw-gap-1:has-text("Fps") button[role="combobox"]').click()
-        time.sleep(1)
-        page.locator(f'[data-item-label="true"]:has-text("{config["fps"]}")').click()
-        time.sleep(1)
-        
-
-        
-        # Select folder (use the heygen_folder_name which includes date/time)
-        print(f"📂 Selecting folder '{heygen_folder_name}'...")
-        page.locator('div.tw-flex.tw-flex-col.tw-gap-1:has-text("Add to folder") button').click()
-        time.sleep(2)
-        
-        try:
-            page.locator(f'input[value="{heygen_folder_name}"]').locator('..').locator('..').locator('..').click()
-            time.sleep(1)
-        except:
-            page.locator(f'div[data-folder-id]:has-text("{heygen_folder_name}")').first.click()
-            time.sleep(1)
-        
-        page.locator('button:has-text("Confirm"):has(iconpark-icon[name="use"])').click()
-        time.sleep(1)
-        print(f"✅ Folder selected: '{heygen_folder_name}'")
-        
-        # Submit
-        print("✅ Submitting video generation...")
-        page.locator('//button[normalize-space()="Submit"]').click()
-        
-        # Wait for submission to complete
+            generate_button = self._cached_locator(page, 'generate_button', 'button:has-text("Generate")')
+            
+            # Check if button is disabled
+            if generate_button.is_disabled():
+                print("\n" + "="*60)
+                print("❌ ERROR: Generate button is disabled!")
+                print("="*60)
+                print("\n⚠️ Possible reasons:")
+                print("   • Avatar doesn't have any audio/script assigned")
+                print("   • Script content is empty or invalid")
+                print("   • Please add audio to the avatar and run the code again.")
+                print("\n" + "="*60 + "\n")
+                return False
+            
+            generate_button.click()
+            page.wait_for_selector('text=Generate video', timeout=5000)
+            print("✅ Generate modal opened")
+        except Exception as gen_error:
+            print("\n" + "="*60)
+            print("❌ ERROR: Could not open Generate modal!")
+            print("="*60)
+            print(f"\n⚠️ Error: {gen_error}")
+            print("\n⚠️ Possible reasons:")
+            print("   • Avatar doesn't have any audio/script assigned")
+            print("   • Script content is empty or invalid")
+            print("   • Please add audio to the avatar and run the code again.")
+            print("\n" + "="*60 + "\n")
+            return False
+        
+        # Set Resolution
+        quality = "1080p" if config['quality'] == "1080p" else "720p"
+        print(f"🎥 Setting resolution to {config['quality']}...")
+        self._select_combobox_option(
+            page, "Resolution", quality,
+            self._cached_locator(page, 'resolution_combobox', 'text=Resolution').locator('..').locator('button[role="combobox"]')
+        )
+        
+        # Set FPS
+        print(f"🎥 Setting FPS to {config['fps']}...")
+        self._select_combobox_option(
+            page, "Fps", str(config["fps"]),
+            self._cached_locator(page, 'fps_combobox', 'div.tw-flex.tw-flex-col.tw-gap-1:has-text("Fps") button[role="combobox"]')
+        )
+        
+
+        
+        # Select folder (use the heygen_folder_name which includes date/time)
+        # The folder list and Submit wait on the server; a failure fails this scene only
+        print(f"📂 Selecting folder '{heygen_folder_name}'...")
+        try:
+            self._cached_locator(page, 'folder_button', 'div.tw-flex.tw-flex-col.tw-gap-1:has-text("Add to folder") button').click()
+            self._wait_dom_settled(
+                page, f'input[value="{heygen_folder_name}"], div[data-folder-id]:has-text("{heygen_folder_name}")',
+                timeout=3000, fallback_seconds=2
+            )
+            
+            try:
+                page.locator(f'input[value="{heygen_folder_name}"]').locator('..').locator('..').locator('..').click()
+            except:
+                page.locator(f'div[data-folder-id]:has-text("{heygen_folder_name}")').first.click(timeout=SERVER_ACTION_TIMEOUT_MS)
+            self._wait_dom_settled(page, 'button:has-text("Confirm"):has(iconpark-icon[name="use"])')
+            
+            self._cached_locator(page, 'folder_confirm', 'button:has-text("Confirm"):has(iconpark-icon[name="use"])').click(timeout=SERVER_ACTION_TIMEOUT_MS)
+            self._wait_dom_settled(page, '//button[normalize-space()="Submit"]')
+            print(f"✅ Folder selected: '{heygen_folder_name}'")
+            
+            # Submit
+            print("✅ Submitting video generation...")
+            self._cached_locator(page, 'submit_button', '//button[normalize-space()="Submit"]').click(timeout=SERVER_ACTION_TIMEOUT_MS)
+        except Exception as e:
+            print(f"❌ Could not submit the video: {e}")
+            return False
+        
+        # Wait for submission to complete (the Generate modal closes)
         print("⏳ Waiting for submission...")
-        time.sleep(5)
-        self._dismiss_modal_overlays(page)
-        
-        
-        # Add to tracking
-        self.add_video_to_project(tracking_data, project_name, scene_folder, script_filename + ".txt", video_name)
-        self.save_tracking(tracking_data)
-        
-        print(f"📋 Tracking updated: {scene_folder}")
-        return True
-    
-    def _navigate_to_project_folder(self, page, heygen_folder_name):
-        """Navigate to a HeyGen project folder (shared helper)
-        Returns: True on success, False on failure
-        """
-        print("📂 Navigating to project folder...")
-        
-        # First go to HeyGen homepage to reset state
-        page.goto("https://www.heygen.com/")
-        time.sleep(3)
-        self._dismiss_rating_popup(page)
+        self._wait_dom_settled(
+            page, '//button[normalize-space()="Submit"]', timeout=10000, state="hidden", fallback_seconds=2
+        )
+        
+        
+        # Add to tracking (logged; the full file is rewritten once the project is done)
+        video_entry = self.add_video_to_project(
+            tracking_data, project_name, scene_folder, script_filename + ".txt", video_name,
+            timestamp=submitted_at.isoformat()
+        )
+        if video_entry is not None:
+            self.append_tracking_event({"op": "add_video", "project": project_name, "video": video_entry})
+        
+        print(f"📋 Tracking updated: {scene_folder}")
+        return True
+    
+    def _submit_project_scenes(self, page, scene_list, config, heygen_folder_name, avatar_name, tracking_data, project_name):
+        """Submit every scene of a project, reading the next scene's script
+        on a background thread while the current one goes through the browser.
+        """
+        total_scenes = len(scene_list)
+        if not total_scenes:
+            return
+        workers = min(self.submission_concurrency, total_scenes)
+        if workers > 1:
+            self._submit_scenes_in_parallel(
+                page, scene_list, config, heygen_folder_name, avatar_name, tracking_data, project_name, workers
+            )
+            return
+        with ThreadPoolExecutor(max_workers=1) as lookahead:
+            upcoming = lookahead.submit(self.read_script_file, scene_list[0][1], SCRIPT_CHAR_LIMIT)
+            for scene_idx, (scene_folder, script_path, script_filename) in enumerate(scene_list, 1):
+                script_text = upcoming.result()
+                if scene_idx < total_scenes:
+                    upcoming = lookahead.submit(self.read_script_file, scene_list[scene_idx][1], SCRIPT_CHAR_LIMIT)
+                
+                print(f"\n   🎬 Submitting Scene {scene_idx}/{total_scenes}: {scene_folder}")
+                
+                success = self._submit_single_video(
+                    page, scene_folder, script_path, script_filename,
+                    config, heygen_folder_name, avatar_name, tracking_data, project_name,
+                    script_text=script_text
+                )
+                
+                if success:
+                    print(f"   ✅ Scene submitted!")
+                else:
+                    print(f"   ❌ Scene failed!")
+
+        # Fold the logged submissions into tracking.json
+        self.save_tracking(tracking_data, defer=True)
+
+    def _submit_scenes_in_parallel(self, page, scene_list, config, heygen_folder_name, avatar_name, tracking_data, project_name, workers):
+        """Split a project's scenes over `workers` browsers (see SUBMISSION_CONCURRENCY):
+        this page takes the first share, worker threads with their own browsers the rest.
+        Every submission is logged to the tracking log as it happens.
+        """
+        print(f"\n   🧵 Submitting {len(scene_list)} scenes with {workers} browsers...")
+        # Workers append to the tracking log, which applies on top of the saved file
+        self.flush_tracking()
+        batches = [scene_list[i::workers] for i in range(workers)]
+        submitted = 0
+        with ThreadPoolExecutor(max_workers=workers - 1) as pool:
+            futures = [
+                pool.submit(
+                    _submit_scene_batch, worker_id, batch, config,
+                    heygen_folder_name, avatar_name, project_name, self.tracking_file
+                )
+                for worker_id, batch in enumerate(batches[1:], 1)
+            ]
+            # Playwright objects belong to the thread that made them, so this page is driven here
+            for scene_idx, (scene_folder, script_path, script_filename) in enumerate(batches[0], 1):
+                print(f"\n   🎬 [worker 0] Submitting Scene {scene_idx}/{len(batches[0])}: {scene_folder}")
+                if self._submit_single_video(
+                    page, scene_folder, script_path, script_filename,
+                    config, heygen_folder_name, avatar_name, tracking_data, project_name
+                ):
+                    submitted += 1
+                else:
+                    print(f"   ❌ [worker 0] Scene failed: {scene_folder}")
+
+            for future in futures:
+                try:
+                    videos = future.result()
+                except Exception as e:
+                    print(f"   ❌ Worker failed: {e}")
+                    continue
+                # Already logged by the worker; only the in-memory copy needs them
+                for video in videos:
+                    self.add_video_to_project(
+                        tracking_data, project_name, video["scene_folder"], video["script_file"],
+                        video["video_name"], timestamp=video["submitted_at"]
+                    )
+                submitted += len(videos)
+
+        # Keep the project's videos in scene order
+        project = self._project_index.get(project_name)
+        if project is not None:
+            scene_order = {scene[0]: idx for idx, scene in enumerate(scene_list)}
+            project["videos"].sort(key=lambda video: scene_order.get(video["scene_folder"], -1))
+        print(f"   ✅ {submitted}/{len(scene_list)} scenes submitted")
+        self.save_tracking(tracking_data, defer=True)
+
+    def _prepare_worker_profiles(self, count):
+        """Copy the Chrome profile for worker browsers 1..count before the main
+        browser opens it, so the copies never catch its databases mid-write.
+        """
+        for worker_id in range(1, count + 1):
+            self._worker_profile_dir(worker_id)
+
+    def _worker_profile_dir(self, worker_id):
+        """Chrome profile for a worker browser; copied from the main profile on first use
+        (delete the chrome_profile_w* folders to pick up a fresh login).
+        """
+        if worker_id <= 0:
+            return self.profile_dir
+        worker_dir = f"{self.profile_dir}_w{worker_id}"
+        if not os.path.exists(worker_dir) and os.path.exists(self.profile_dir):
+            print(f"📋 Copying Chrome profile for worker {worker_id}...")
+            # Lock files belong to the browser that has the main profile open
+            shutil.copytree(self.profile_dir, worker_dir, ignore=shutil.ignore_patterns("Singleton*", "lockfile"))
+        return worker_dir
+
+    def _navigate_to_project_folder(self, page, heygen_folder_name):
+        """Navigate to a HeyGen project folder (shared helper)
+        Returns: True on success, False on failure
+        """
+        # Already showing this folder
+        if (heygen_folder_name == self._current_folder and self._current_folder_url
+                and page.url == self._current_folder_url):
+            return True
+        
+        print("📂 Navigating to project folder...")
+        # Find folder by name in span (works with both folder icon and loading spinner)
+        folder_element = page.locator(f'div[draggable="true"]:has(span.tw-text-textTitle:text-is("{heygen_folder_name}"))').first
+        projects_menu = page.locator('[data-testid="projects-menu"]')
+        
+        self._current_folder = None
+        self._current_folder_url = None
+        
+        # Go to the HeyGen homepage first unless the app (with its Projects menu) is already open
+        if not projects_menu.is_visible():
+            self._open_heygen_home(page)
+            self._dismiss_rating_popup(page)
         
         # Click Projects menu
-        page.locator('[data-testid="projects-menu"]').click()
-        time.sleep(5)  # Wait longer for folders to load
-        
-        # Find and click the folder
-        print(f"🔍 Looking for folder: {heygen_folder_name}")
-        try:
-            # Find folder by name in span (works with both folder icon and loading spinner)
-            folder_element = page.locator(f'div[draggable="true"]:has(span.tw-text-textTitle:text-is("{heygen_folder_name}"))').first
-            folder_element.dblclick()
-            time.sleep(3)
-            print(f"✅ Opened folder: {heygen_folder_name}")
-            return True
-        except Exception as e:
-            print(f"❌ Could not find folder '{heygen_folder_name}'")
-            print(f"   Error: {e}")
-            print("   Please make sure the folder exists in HeyGen.")
-            return False
-    
-    def _download_single_video(self, page, video, tracking_data):
-        """Download a single completed video (shared helper)
-        Returns: True on success, False on failure
-        """
-        try:
-            print(f"   📥 Downloading: {video['scene_folder']}")
-            
-            # Find the video card
-            video_cards = page.locator('div.tw-group:has(iconpark-icon[name="play"])').all()
-            video_name_to_find = video["video_name"]
-            
-            target_video = None
-            for card in video_cards:
-                try:
-                    card_text = card.inner_text()
-                    if video_name_to_find in card_text:
-                        target_video = card
-                        print(f"   ✅ Found matching video: {video_name_to_find}")
-                        break
-                except:
-                    pass
-            
-            if not target_video:
-                print(f"   ⏳ {video['scene_folder']} not ready yet...")
-                return False
-            
-            target_video.hover()
-            time.sleep(1)
-            
-            three_dot_button = target_video.locator('button:has(iconpark-icon[name="more-level"])')
-            three_dot_button.click()
-            time.sleep(1)
-            
-            page.locator('div.tw-cursor-pointer.hover\\:tw-bg-ux-hover:has(iconpark-icon[name="download"]):has-text("Download")').click()
-            time.sleep(2)
-            
-            page.locator('button:has(iconpark-icon[name="download"]):has-text("Download")').click()
-            
-            print("   ⏳ Waiting for download to complete...")
+        projects_menu.click()
+        
+        # Find and click the folder
+        print(f"🔍 Looking for folder: {heygen_folder_name}")
+        try:
+            # Folders load after the Projects view renders
+            folder_element.wait_for(state="visible", timeout=10000)
+            projects_url = page.url
+            folder_element.dblclick()
+            try:
+                # The folder tile goes away once the folder view opens
+                folder_element.wait_for(state="detached", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+            print(f"✅ Opened folder: {heygen_folder_name}")
+            self._current_folder = heygen_folder_name
+            # Only a folder with its own URL can be refreshed by reloading the page
+            if page.url != projects_url:
+                self._current_folder_url = page.url
+            return True
+        except Exception as e:
+            print(f"❌ Could not find folder '{heygen_folder_name}'")
+            print(f"   Error: {e}")
+            print("   Please make sure the folder exists in HeyGen.")
+            return False
+    
+    def _refresh_project_folder(self, page, heygen_folder_name):
+        """Show up-to-date cards for a folder, reloading in place when already inside it
+        Returns: True on success, False on failure
+        """
+        if (heygen_folder_name == self._current_folder and self._current_folder_url
+                and page.url == self._current_folder_url):
+            try:
+                page.reload(wait_until="domcontentloaded")
+                # Wait for the whole list, not just the first card, before it gets indexed
+                page.wait_for_function(
+                    _CARD_COUNT_SETTLED_JS,
+                    arg={"selector": VIDEO_CARD_SELECTOR, "quietMs": 500},
+                    polling=100,
+                    timeout=5000,
+                )
+                return True
+            except PlaywrightTimeoutError:
+                # No finished videos rendered yet (or still loading); the folder is still open
+                return True
+            except Exception as e:
+                print(f"      ⚠️ Reload failed ({e}); navigating to the folder again...")
+        return self._navigate_to_project_folder(page, heygen_folder_name)
+
+    def _start_video_download(self, page, video_card):
+        """Open a video card's menu and confirm the download dialog.
+        Each step waits for the element it needs rather than sleeping.
+        """
+        video_card.hover()
+        three_dot_button = video_card.locator('button:has(iconpark-icon[name="more-level"])')
+        three_dot_button.wait_for(state="visible", timeout=1500)
+        three_dot_button.click()
+        
+        download_item = page.locator('div.tw-cursor-pointer.hover\\:tw-bg-ux-hover:has(iconpark-icon[name="download"]):has-text("Download")')
+        download_item.wait_for(state="visible", timeout=1500)
+        download_item.click()
+        
+        download_button = page.locator('button:has(iconpark-icon[name="download"]):has-text("Download")')
+        download_button.wait_for(state="visible", timeout=1500)
+        download_button.click()
+
+    def _finalize_download(self, latest_file, video_name):
+        """Rename a finished download after its video (keeping the extension)
+        Returns: the new file name inside output_files_dir
+        """
+        file_extension = os.path.splitext(latest_file)[1] or ".mp4"
+        new_filename = f"{self._sanitize_filename(video_name)}{file_extension}"
+        # Overwrites an older download of the same video in one atomic step
+        os.replace(latest_file, os.path.join(self.output_files_dir, new_filename))
+        return new_filename
+
+    def _download_single_video(self, page, video, tracking_data):
+        """Download a single completed video (shared helper)
+        Returns: True on success, False on failure
+        """
+        try:
+            print(f"   📥 Downloading: {video['scene_folder']}")
+            
+            # Find the video card
+            video_name_to_find = video["video_name"]
+            card_index = self._index_cards(page, [video_name_to_find])
+            
+            if video_name_to_find not in card_index:
+                print(f"   ⏳ {video['scene_folder']} not ready yet...")
+                return False
+            
+            target_video = page.locator(VIDEO_CARD_SELECTOR).nth(card_index[video_name_to_find])
+            print(f"   ✅ Found matching video: {video_name_to_find}")
+            
+            self._start_video_download(page, target_video)
+            
+            print("   ⏳ Waiting for download to complete...")
             latest_file = self.wait_for_latest_download(self.output_files_dir)
-            
-            if latest_file:
-                file_extension = os.path.splitext(latest_file)[1] or ".mp4"
-                safe_name = self._sanitize_filename(video["video_name"])
-                new_filename = f"{safe_name}{file_extension}"
-                new_path = os.path.join(self.output_files_dir, new_filename)
-                
-                if os.path.exists(new_path):
-                    os.remove(new_path)
-                
-                os.rename(latest_file, new_path)
-                
-                self.update_video_status(tracking_data, video["scene_folder"], "downloaded", new_filename)
-                self.save_tracking(tracking_data)
-                
-                print(f"   ✅ Downloaded: {new_filename}")
-                return True
+            
+            if latest_file:
+                new_filename = self._finalize_download(latest_file, video["video_name"])
+                
+                self.record_video_status(tracking_data, video["scene_folder"], "downloaded", new_filename)
+                
+                print(f"   ✅ Downloaded: {new_filename}")
+                return True
             else:
                 print("   ❌ Download did not complete.")
                 return False
-                
-        except Exception as e:
-            print(f"   ❌ Error downloading: {e}")
-            self.update_video_status(tracking_data, video["scene_folder"], "processing", error_message=str(e))
-            self.save_tracking(tracking_data)
-            return False
-    
+                
+        except Exception as e:
+            print(f"   ❌ Error downloading: {e}")
+            self.record_video_status(tracking_data, video["scene_folder"], "processing", error_message=str(e))
+            return False
+    
+    def _wait_for_render_completed(self, page, render_completed, seconds):
+        """Wait up to seconds between poll cycles, ending early once render_completed is set.
+        Always waits POLLING_MIN_SLEEP_SECONDS first so a chatty status API cannot make
+        cycles run faster than before. Uses page waits so Playwright keeps delivering events.
+        Returns: True if the wait was cut short
+        """
+        min_wait_ms = int(min(seconds, POLLING_MIN_SLEEP_SECONDS) * 1000)
+        deadline = time.monotonic() + seconds
+        render_completed.clear()
+        page.wait_for_timeout(min_wait_ms)
+        while not render_completed.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            page.wait_for_timeout(min(1000, remaining * 1000))
+        return True
+
+    @staticmethod
+    def _completed_render_names(body):
+        """Names of the finished videos in a HeyGen API response body (empty if not JSON)"""
+        try:
+            payload = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError:
+            return set()
+        names = set()
+        stack = [payload]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                if item.get("status") in _RENDER_COMPLETED_STATUSES:
+                    names.update(
+                        value for key, value in item.items()
+                        if key in _RENDER_NAME_KEYS and isinstance(value, str)
+                    )
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+        return names
+
     def _poll_and_download_loop(self, page, tracking_data):
         """Long-running poll loop for completed video downloads."""
         
         start_time = time.time()
         cycle = 0
+        sleep_seconds = POLLING_MIN_SLEEP_SECONDS
         
         print("\n⏳ Starting polling loop. No timeout; press Ctrl+C to stop.")
+
+        render_completed = threading.Event()
+        # Names of the videos still processing; only their completion ends a wait early,
+        # not the older finished videos every status response also lists
+        pending_names = set()
+
+        def on_response(response):
+            if (response.request.resource_type not in ("xhr", "fetch")
+                    or not _RENDER_STATUS_URL_RE.search(response.url)):
+                return
+            try:
+                body = response.text()
+            except Exception:
+                return  # Body unavailable (redirect, page navigated away)
+            if (_RENDER_COMPLETED_RE.search(body)
+                    and not pending_names.isdisjoint(self._completed_render_names(body))):
+                render_completed.set()
+
+        page.on("response", on_response)
         
-        while True:
-            # Refresh tracking data from file (in case we want to support dynamic updates, 
-            # though currently we just use the passed dict. Good practice to reload if passing file path)
-            # tracking_data = self.load_tracking() # Optional if we moved to file-based state
-            
-            projects = tracking_data.get("projects", [])
-            total_pending_all = 0
-            projects_with_pending = []
-            
-            for project in projects:
-                pending_count = sum(1 for v in project["videos"] if v["status"] == "processing")
-                if pending_count > 0:
-                    total_pending_all += pending_count
-                    projects_with_pending.append(project)
-            
-            if total_pending_all == 0:
-                print("\n🎉 All videos in all projects downloaded!")
-                break
-                
-            cycle += 1
-            print(f"\n🔄 Cycle {cycle}: {total_pending_all} videos pending across {len(projects_with_pending)} projects")
-            print(f"   (Elapsed: {int((time.time()-start_time)/60)} min)")
-
-            # Cycle through each project that has pending videos
-            for project in projects_with_pending:
-                folder_name = project['heygen_folder_name']
-                print(f"\n   📂 Switching to folder: {folder_name}")
-                
-                # Navigate to the specific folder
-                if not self._navigate_to_project_folder(page, folder_name):
-                    print("      ❌ Could not open folder, skipping this cycle.")
-                    continue
-                
-                # Check videos in this folder
-                # We are now inside the folder, so we scan the video cards here
-                try:
-                    video_cards = page.locator('div.tw-group:has(iconpark-icon[name="play"])').all()
-                    
-                    pending_videos = [v for v in project["videos"] if v["status"] == "processing"]
-                    for video in pending_videos:
-                         self._download_if_ready(page, video, project, tracking_data, video_cards)
-                         
-                except Exception as e:
-                    print(f"      ⚠️ Error checking folder: {e}")
-
-            # Wait before next full cycle
-            print(f"\n   💤 Waiting {POLLING_SLEEP_SECONDS}s before next cycle...")
-            time.sleep(POLLING_SLEEP_SECONDS)
-
-        return tracking_data
-
-    def _download_if_ready(self, page, video, project, tracking_data, video_cards):
-        """Try to download a specific video if it appears in video_cards"""
-        video_name_to_find = video["video_name"]
-        
-        target_video = None
-        for card in video_cards:
-            try:
-                if video_name_to_find in card.inner_text():
-                    target_video = card
-                    break
-            except:
-                pass
-        
-        if target_video:
-            print(f"      ✅ Ready: {video['scene_folder']}")
-            # Download logic (reused)
-            try:
-                target_video.hover()
-                time.sleep(1)
-                target_video.locator('button:has(iconpark-icon[name="more-level"])').click()
-                time.sleep(1)
-                page.locator('div.tw-cursor-pointer.hover\\:tw-bg-ux-hover:has(iconpark-icon[name="download"]):has-text("Download")').click()
-                time.sleep(2)
-                page.locator('button:has(iconpark-icon[name="download"]):has-text("Download")').click()
-                
+        try:
+            while True:
+                # Refresh tracking data from file (in case we want to support dynamic updates, 
+                # though currently we just use the passed dict. Good practice to reload if passing file path)
+                # tracking_data = self.load_tracking() # Optional if we moved to file-based state
+            
+                projects = tracking_data.get("projects", [])
+                total_pending_all = 0
+                projects_with_pending = []
+            
+                for project in projects:
+                    pending_count = sum(1 for v in project["videos"] if v["status"] == "processing")
+                    if pending_count > 0:
+                        total_pending_all += pending_count
+                        projects_with_pending.append(project)
+            
+                if total_pending_all == 0:
+                    print("\n🎉 All videos in all projects downloaded!")
+                    break
+                
+                cycle += 1
+                print(f"\n🔄 Cycle {cycle}: {total_pending_all} videos pending across {len(projects_with_pending)} projects")
+                print(f"   (Elapsed: {int((time.time()-start_time)/60)} min)")
+
+                # Cycle through each project that has pending videos
+                downloaded_any = False
+                for project in projects_with_pending:
+                    folder_name = project['heygen_folder_name']
+                    print(f"\n   📂 Switching to folder: {folder_name}")
+                
+                    # Open the folder (or just reload it if we're already there)
+                    if not self._refresh_project_folder(page, folder_name):
+                        print("      ❌ Could not open folder, skipping this cycle.")
+                        continue
+                
+                    # Check videos in this folder
+                    # We are now inside the folder, so we scan the video cards here
+                    try:
+                        pending_videos = [v for v in project["videos"] if v["status"] == "processing"]
+                        card_index = self._index_cards(page, [v["video_name"] for v in pending_videos])
+                        ready_videos = [v for v in pending_videos if v["video_name"] in card_index]
+                        if not ready_videos:
+                            print("      ⏳ No finished videos in this folder yet")
+                        for video in ready_videos:
+                             if self._download_if_ready(page, video, project, tracking_data, card_index):
+                                 downloaded_any = True
+                         
+                    except Exception as e:
+                        print(f"      ⚠️ Error checking folder: {e}")
+
+                # Wait before next full cycle: short while videos keep finishing, backing off when idle
+                if downloaded_any:
+                    sleep_seconds = POLLING_MIN_SLEEP_SECONDS
+                print(f"\n   💤 Waiting {int(sleep_seconds)}s before next cycle...")
+                pending_names.clear()
+                pending_names.update(
+                    v["video_name"] for project in projects_with_pending
+                    for v in project["videos"] if v["status"] == "processing"
+                )
+                if self._wait_for_render_completed(page, render_completed, sleep_seconds):
+                    print("   🔔 HeyGen reported a pending video as finished")
+                sleep_seconds = min(sleep_seconds * POLLING_BACKOFF, POLLING_SLEEP_SECONDS)
+        finally:
+            page.remove_listener("response", on_response)
+            # Statuses were logged as they changed; fold them into tracking.json (also on Ctrl+C)
+            self.save_tracking(tracking_data)
+
+        return tracking_data
+
+    def _index_cards(self, page, names):
+        """Locate video cards for the given names in a single page round-trip
+        Returns: dict mapping each found name to its card index
+        """
+        if not names:
+            return {}
+        try:
+            return page.evaluate(_INDEX_VIDEO_CARDS_JS, {"selector": VIDEO_CARD_SELECTOR, "names": names})
+        except Exception as e:
+            print(f"      ⚠️ Could not read video cards: {e}")
+            return {}
+
+    def _download_if_ready(self, page, video, project, tracking_data, card_index):
+        """Try to download a specific video if it appears in card_index (see _index_cards)
+        Returns: True if the video was downloaded
+        """
+        index = card_index.get(video["video_name"])
+        
+        if index is not None:
+            target_video = page.locator(VIDEO_CARD_SELECTOR).nth(index)
+            print(f"      ✅ Ready: {video['scene_folder']}")
+            # Download logic (reused)
+            try:
+                self._start_video_download(page, target_video)
+                
                 latest_file = self.wait_for_latest_download(self.output_files_dir)
-                if latest_file:
-                     # Rename
-                    file_extension = os.path.splitext(latest_file)[1] or ".mp4"
-                    safe_name = self._sanitize_filename(video["video_name"])
-                    new_filename = f"{safe_name}{file_extension}"
-                    new_path = os.path.join(self.output_files_dir, new_filename)
-                    if os.path.exists(new_path):
-                         os.remove(new_path)
-                    os.rename(latest_file, new_path)
-                    
-                    self.update_video_status(tracking_data, video["scene_folder"], "downloaded", new_filename)
-                    self.save_tracking(tracking_data)
-                    print(f"      📥 Downloaded: {new_filename}")
-            except Exception as e:
-                print(f"      ❌ Download error: {e}")
-        else:
-            # Not ready
-            pass
-    
-    # ============================================
-    # MODE 1: SUBMIT NEW VIDEOS
-    # ============================================
-    
-    def run_submission_mode(self):
-        """Batch submit all videos from selected project"""
-        
-        # Get project and scenes
-        project_name, scene_list = self.get_project_info()
-        
-        # Get user preferences (once for all videos)
-        config = self.get_user_preferences()
-        
-        # Create HeyGen folder name with date + time + project name
-        folder_datetime = datetime.now().strftime("%m-%d-%Y %I-%M %p")
-        heygen_folder_name = f"{folder_datetime} {project_name}"
-        
-        # Create tracking data
-        tracking_data = self.create_new_tracking(project_name, heygen_folder_name, config)
-        
-        with sync_playwright() as p:
-            context = self.launch_browser(p)
-            if not context:
-                return
-            
-            try:
-                page = self._get_or_create_page(context)
-                
-                # Navigate to HeyGen
-                print("🌐 Navigating to HeyGen...")
-                page.goto("https://www.heygen.com/")
-                time.sleep(3)
-                
-                print("\n" + "="*60)
-                print("🚀 Starting Batch Submission Workflow")
-                print("="*60 + "\n")
-                
-                # Create folder
-                self._create_heygen_folder(page, heygen_folder_name)
-                
-                # Select avatar
-                selected_avatar_idx, selected_avatar = self._select_avatar_interactive(page)
-                if selected_avatar_idx is None:
-                    return
-                
-                config["avatar_name"] = selected_avatar
-                tracking_data["config"] = config
-                
-                # Process each scene
-                total_scenes = len(scene_list)
-                
-                for scene_idx, (scene_folder, script_path, script_filename) in enumerate(scene_list, 1):
-                    print("\n" + "="*60)
-                    print(f"🎬 Processing Scene {scene_idx}/{total_scenes}: {scene_folder}")
-                    print("="*60 + "\n")
-                    
-                    success = self._submit_single_video(
-                        page, scene_folder, script_path, script_filename,
-                        config, heygen_folder_name, selected_avatar_idx, tracking_data
-                    )
-                    
-                    if not success:
-                        return  # Stop on failure
-                    
-                    print(f"✅ Scene {scene_idx}/{total_scenes} submitted!")
-                    
-                    # Small delay before next submission
-                    if scene_idx < total_scenes:
-                        print("\n⏳ Waiting 5 seconds before next submission...")
-                        time.sleep(5)
-                
-                # Submission complete
-                print("\n" + "="*60)
-                print("🎉 BATCH SUBMISSION COMPLETE!")
-                print("="*60)
-                print(f"\n📁 Project: {project_name}")
-                print(f"📹 Videos submitted: {total_scenes}")
-                print(f"📋 Tracking file: {self.tracking_file}")
-                print(f"📂 HeyGen folder: {heygen_folder_name}")
-                print("\n💡 Run the script again and select 'Option 2' to check and download videos.")
-                print("   Videos should be ready in approximately 30 minutes.")
-                print("\n" + "="*60 + "\n")
-                
-            except Exception as e:
-                print(f"\n❌ Error during submission: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                context.close()
-                print("✅ Submission mode complete. Browser closed.")
-    
-    # ============================================
-    # MODE 2: CHECK & DOWNLOAD PENDING VIDEOS
-    # ============================================
-    
-    def run_download_mode(self):
-        """Check and download pending videos"""
-        
-        # Load tracking data
-        tracking_data = self.load_tracking()
-        
-        if not tracking_data:
-            print("\n❌ No tracking data found!")
-            print(f"   Looking for: {self.tracking_file}")
-            print("   Please run 'Submit new videos' first.")
-            return
-        
-        # Show summary
-        project_name = tracking_data["project_name"]
-        videos = tracking_data["videos"]
-        
-        downloaded = sum(1 for v in videos if v["status"] == "downloaded")
-        pending = sum(1 for v in videos if v["status"] == "processing")
-        
-        print("\n" + "="*60)
-        print("📥 CHECK & DOWNLOAD PENDING VIDEOS")
-        print("="*60 + "\n")
-        
-        heygen_folder_name = tracking_data.get("heygen_folder_name", project_name)
-        print(f"📁 Project: {project_name}")
-        print(f"📊 Status: {downloaded}/{len(videos)} downloaded, {pending} pending")
-        print(f"📂 HeyGen folder: {heygen_folder_name}")
-        print("")
-        
-        if pending == 0:
-            print("✅ All videos have been downloaded!")
-            return
-        
-        # Show pending videos with time elapsed
-        print("⏳ Pending videos:")
-        now = datetime.now()
-        min_time_remaining = float('inf')
-        
-        for video in videos:
-            if video["status"] == "processing":
-                submitted = datetime.fromisoformat(video["submitted_at"])
-                elapsed = now - submitted
-                elapsed_minutes = int(elapsed.total_seconds() / 60)
-                time_remaining = max(0, 30 - elapsed_minutes)
-                min_time_remaining = min(min_time_remaining, time_remaining)
-                ready_marker = "✅ Ready to check" if elapsed_minutes >= 30 else f"⏳ {time_remaining} min until check"
-                print(f"   • {video['scene_folder']} ({elapsed_minutes} min ago) - {ready_marker}")
-        print("")
-        
-        # Ask user what to do
-        if min_time_remaining > 0:
-            print(f"⏰ Earliest video will be ready for check in {int(min_time_remaining)} minutes.")
-            print("\nOptions:")
-            print("  1. Wait for videos to finish (auto-poll every 90 seconds)")
-            print("  2. Check now (skip videos not yet ready)")
-            print("  3. Cancel")
-            
-    def run_submission_mode(self):
-        """Batch submit new videos (Queue System - Submission Only)"""
-        print("\n" + "="*60)
-        print("� SUBMISSION MODE (Option 1)")
-        print("="*60)
-
-        # 0. Check for Existing Session to Append
-        resume_mode = False
-        existing_tracking = self.load_tracking()
-        
-        if existing_tracking and "projects" in existing_tracking and len(existing_tracking["projects"]) > 0:
-            print("\n⚠️ Found existing tracking session from:", existing_tracking.get("session_start", "Unknown"))
-            resume_choice = input("👉 Append to this session? (1. Yes / 2. Start New): ").strip()
-            if resume_choice == "1":
-                print("✅ Appending to existing session...")
-                tracking_data = existing_tracking
-                resume_mode = True
-            else:
-                print("🆕 Starting fresh session (old tracking.json overwritten)")
-                tracking_data = self.create_new_tracking_session()
-                self.save_tracking(tracking_data)
-        else:
-            tracking_data = self.create_new_tracking_session()
-            self.save_tracking(tracking_data)
-
-        # 1. Build the Queue
-        job_queue = self.build_job_queue()
-        if not job_queue:
-            print("❌ No jobs queued.")
-            return
-
-        # Get user preferences (Quality/FPS) - Global
-        config = self.get_user_preferences()
-        
-        with sync_playwright() as p:
-            context = self.launch_browser(p)
-            if not context:
-                return
-            
-            try:
-                page = self._get_or_create_page(context)
-                
-                print("🌐 Navigating to HeyGen...")
-                page.goto("https://www.heygen.com/")
-                time.sleep(3)
-                
-                job_count = len(job_queue)
-                for job_idx, job in enumerate(job_queue, 1):
-                    avatar_name = job["avatar"]
-                    projects_data = job["projects"]
-                    
-                    print(f"\n🏭 Processing Job {job_idx}/{job_count}")
-                    print(f"   👤 Avatar: {avatar_name}")
-                    print(f"   � Projects: {[p[0] for p in projects_data]}")
-                    
-                    config["avatar_name"] = avatar_name
-                    
-                    for project_name, scene_list in projects_data:
-                        print(f"\n   👉 Starting Project: {project_name}")
-                        
-                        # Create unique folder
-                        folder_datetime = datetime.now().strftime("%m-%d-%Y %I-%M %p")
-                        heygen_folder_name = f"{folder_datetime} {project_name}"
-                        
-                        # Add project to tracking
-                        self.add_project_to_tracking(tracking_data, project_name, heygen_folder_name, config)
-                        self.save_tracking(tracking_data)
-                        
-                        # Create Folder on HeyGen
-                        self._create_heygen_folder(page, heygen_folder_name)
-                        
-                        # Process Scenes
-                        total_scenes = len(scene_list)
-                        for scene_idx, (scene_folder, script_path, script_filename) in enumerate(scene_list, 1):
-                            print(f"\n   🎬 Submitting Scene {scene_idx}/{total_scenes}: {scene_folder}")
-                            
-                            success = self._submit_single_video(
-                                page, scene_folder, script_path, script_filename,
-                                config, heygen_folder_name, avatar_name, tracking_data, project_name
-                            )
-                            
-                            if success:
-                                print(f"   ✅ Scene submitted!")
-                            else:
-                                print(f"   ❌ Scene failed!")
-                                
-                            if scene_idx < total_scenes:
-                                time.sleep(5)
-                                
-                    print(f"\n✅ Job {job_idx} Complete!")
-
-                print("\n" + "="*60)
-                print("✅ SUBMISSION PHASE COMPLETE")
-                print("="*60)
-                print("💡 Use Option 2 to check status and download videos later.")
-                
-            except KeyboardInterrupt:
-                print("\n\n⚠️ Stopped by user (Ctrl+C)")
-            except Exception as e:
-                print(f"\n❌ Error during submission: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                context.close()
-                print("✅ Browser closed.")
-    
-
-    def run_download_mode(self):
-        """Check and download pending videos (Multi-Project)"""
-        print("\n" + "="*60)
-        print("📥 DOWNLOAD MODE (Option 2)")
-        print("="*60)
-        
-        # Load tracking data
-        tracking_data = self.load_tracking()
-        
-        if not tracking_data or "projects" not in tracking_data or not tracking_data["projects"]:
-            print("\n❌ No valid tracking session found!")
-            print(f"   Looking for: {self.tracking_file}")
-            print("   Please run Option 1 or 3 first to create jobs.")
-            return
-
-        print(f"\n✅ Found tracking session started at: {tracking_data.get('session_start')}")
-        print(f"   Monitoring {len(tracking_data['projects'])} projects.")
-
-        with sync_playwright() as p:
-            context = self.launch_browser(p)
-            if not context:
-                return
-            
-            try:
-                page = self._get_or_create_page(context)
-                
-                print("🌐 Navigating to HeyGen...")
-                page.goto("https://www.heygen.com/")
-                time.sleep(3)
-                
-                # Check directly into polling loop
-                self._poll_and_download_loop(page, tracking_data)
-
-            except KeyboardInterrupt:
-                print("\n\n⚠️ Stopped by user (Ctrl+C)")
-            except Exception as e:
-                print(f"\n❌ Error during download check: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                context.close()
-                print("✅ Browser closed.")
-
-    # ============================================
-    # MODE 3: UNATTENDED MODE (SUBMIT + DOWNLOAD)
-    # ============================================
-    
-    
-    def build_job_queue(self):
-        """Interactive loop to build the job queue"""
-        job_queue = []
-        
-        # Load avatars
-        avatars = self.load_config()
-        if not avatars:
-            print("❌ No avatars found in config.txt. Please verify the file.")
-            return []
-            
-        print("\n" + "="*60)
-        print("🏭 JOB QUEUE BUILDER")
-        print("="*60)
-        
-        while True:
-            # 1. Select Projects
-            selected_projects_data = self.get_project_info()
-            if not selected_projects_data:
-                break
-                
-            # 2. Select Avatar
-            print("\n" + "="*60)
-            print("👽 AVAILABLE AVATARS (from config.txt)")
-            print("="*60)
-            for idx, av in enumerate(avatars, 1):
-                print(f"  {idx}. {av}")
-                
-            while True:
-                try:
-                    choice = int(input(f"\n👉 Select avatar to apply (1-{len(avatars)}): "))
-                    if 1 <= choice <= len(avatars):
-                        selected_avatar = avatars[choice-1]
-                        print(f"✅ Selected Avatar: {selected_avatar}")
-                        break
-                    print("❌ Invalid selection")
-                except:
-                    print("❌ Invalid input")
-            
-            # Add to queue
-            job_queue.append({
-                "projects": selected_projects_data, # List of (project_name, scene_list)
-                "avatar": selected_avatar
-            })
-            
-            print(f"\n✅ Added to Queue. Current Jobs: {len(job_queue)}")
-            
-            # 3. Queue more?
-            more = input("\n👉 Queue more projects? (1. Yes / 2. No): ").strip()
-            if more != "1":
-                break
-                
-        return job_queue
-
+                if latest_file:
+                    new_filename = self._finalize_download(latest_file, video["video_name"])
+                    
+                    self.record_video_status(tracking_data, video["scene_folder"], "downloaded", new_filename)
+                    print(f"      📥 Downloaded: {new_filename}")
+                    return True
+            except Exception as e:
+                print(f"      ❌ Download error: {e}")
+        # Not ready (or the download failed)
+        return False
+    
+    # ============================================
+    # MODE 1: SUBMIT NEW VIDEOS
+    # ============================================
+    
+    def run_submission_mode(self):
+        """Batch submit new videos (Queue System - Submission Only)"""
+        print("\n" + "="*60)
+        print("� SUBMISSION MODE (Option 1)")
+        print("="*60)
+
+        # 0. Check for Existing Session to Append
+        resume_mode = False
+        existing_tracking = self.load_tracking()
+        
+        if existing_tracking and "projects" in existing_tracking and len(existing_tracking["projects"]) > 0:
+            print("\n⚠️ Found existing tracking session from:", existing_tracking.get("session_start", "Unknown"))
+            resume_choice = input("👉 Append to this session? (1. Yes / 2. Start New): ").strip()
+            if resume_choice == "1":
+                print("✅ Appending to existing session...")
+                tracking_data = existing_tracking
+                resume_mode = True
+            else:
+                print("🆕 Starting fresh session (old tracking.json overwritten)")
+                tracking_data = self.create_new_tracking_session()
+                self.save_tracking(tracking_data)
+        else:
+            tracking_data = self.create_new_tracking_session()
+            self.save_tracking(tracking_data)
+
+        # 1. Build the Queue
+        job_queue = self.build_job_queue()
+        if not job_queue:
+            print("❌ No jobs queued.")
+            return
+
+        # Get user preferences (Quality/FPS) - Global
+        config = self.get_user_preferences()
+        
+        with self._browser_session("submission") as page:
+            if page is None:
+                return
+            
+            job_count = len(job_queue)
+            for job_idx, job in enumerate(job_queue, 1):
+                self._process_job(page, job_idx, job_count, job, config, tracking_data)
+
+            print("\n" + "="*60)
+            print("✅ SUBMISSION PHASE COMPLETE")
+            print("="*60)
+            print("💡 Use Option 2 to check status and download videos later.")
+    
+    # ============================================
+    # MODE 2: CHECK & DOWNLOAD PENDING VIDEOS
+    # ============================================
+
+    def run_download_mode(self):
+        """Check and download pending videos (Multi-Project)"""
+        print("\n" + "="*60)
+        print("📥 DOWNLOAD MODE (Option 2)")
+        print("="*60)
+        
+        # Load tracking data
+        tracking_data = self.load_tracking()
+        
+        if not tracking_data or "projects" not in tracking_data or not tracking_data["projects"]:
+            print("\n❌ No valid tracking session found!")
+            print(f"   Looking for: {self.tracking_file}")
+            print("   Please run Option 1 or 3 first to create jobs.")
+            return
+
+        print(f"\n✅ Found tracking session started at: {tracking_data.get('session_start')}")
+        print(f"   Monitoring {len(tracking_data['projects'])} projects.")
+
+        with self._browser_session("download check") as page:
+            if page is None:
+                return
+            
+            # Check directly into polling loop
+            self._poll_and_download_loop(page, tracking_data)
+
+    # ============================================
+    # MODE 3: UNATTENDED MODE (SUBMIT + DOWNLOAD)
+    # ============================================
+    
+    
+    def build_job_queue(self):
+        """Interactive loop to build the job queue"""
+        job_queue = []
+        
+        # Load avatars
+        avatars = self.load_config()
+        if not avatars:
+            print("❌ No avatars found in config.txt. Please verify the file.")
+            return []
+            
+        print("\n" + "="*60)
+        print("🏭 JOB QUEUE BUILDER")
+        print("="*60)
+        
+        while True:
+            # 1. Select Projects
+            selected_projects_data = self.get_project_info()
+            if not selected_projects_data:
+                break
+                
+            # 2. Select Avatar
+            print("\n" + "="*60)
+            print("👽 AVAILABLE AVATARS (from config.txt)")
+            print("="*60)
+            for idx, av in enumerate(avatars, 1):
+                print(f"  {idx}. {av}")
+                
+            while True:
+                try:
+                    choice = int(input(f"\n👉 Select avatar to apply (1-{len(avatars)}): "))
+                    if 1 <= choice <= len(avatars):
+                        selected_avatar = avatars[choice-1]
+                        print(f"✅ Selected Avatar: {selected_avatar}")
+                        break
+                    print("❌ Invalid selection")
+                except:
+                    print("❌ Invalid input")
+            
+            # Add to queue
+            job_queue.append({
+                "projects": selected_projects_data, # List of (project_name, scene_list)
+                "avatar": selected_avatar
+            })
+            
+            print(f"\n✅ Added to Queue. Current Jobs: {len(job_queue)}")
+            
+            # 3. Queue more?
+            more = input("\n👉 Queue more projects? (1. Yes / 2. No): ").strip()
+            if more != "1":
+                break
+                
+        return job_queue
+
+    def _process_job(self, page, job_idx, job_count, job, config, tracking_data):
+        """Create a folder and submit all scenes for each project of one queued job"""
+        avatar_name = job["avatar"]
+        projects_data = job["projects"]
+        
+        print(f"\n🏭 Processing Job {job_idx}/{job_count}")
+        print(f"   👤 Avatar: {avatar_name}")
+        print(f"   📂 Projects: {[p[0] for p in projects_data]}")
+        
+        config["avatar_name"] = avatar_name
+        # One stamp per job: its folders share a prefix even if the projects span a minute boundary
+        folder_datetime = f"{datetime.now():{FOLDER_DATETIME_FORMAT}}"
+        
+        for project_name, scene_list in projects_data:
+            print(f"\n   👉 Starting Project: {project_name}")
+            
+            # Create unique folder (project names within a job are distinct)
+            started_at = datetime.now()
+            heygen_folder_name = f"{folder_datetime} {project_name}"
+            
+            # Create Folder on HeyGen
+            if not self._create_heygen_folder(page, heygen_folder_name):
+                print(f"   ❌ Skipping project {project_name}")
+                continue
+            
+            # Add project to tracking
+            self.add_project_to_tracking(
+                tracking_data, project_name, heygen_folder_name, config,
+                timestamp=started_at.isoformat()
+            )
+            self.save_tracking(tracking_data, defer=True)
+            
+            # Process Scenes
+            self._submit_project_scenes(
+                page, scene_list, config, heygen_folder_name, avatar_name, tracking_data, project_name
+            )
+                    
+        print(f"\n✅ Job {job_idx} Complete!")
+
+    def _run_jobs_in_processes(self, job_queue, config, tracking_data, workers):
+        """Submit queued jobs from a pool of worker processes, each with its own
+        browser and profile copy, then merge their tracking shards into tracking_data.
+        """
+        job_count = len(job_queue)
+        job_chains = self._chain_jobs_sharing_projects(job_queue)
+        workers = min(workers, len(job_chains))
+        print(f"\n🧵 Submitting {job_count} jobs with {workers} browser processes...")
+        job_args = [(job_chain, job_count, config, self.tracking_file) for job_chain in job_chains]
+        self._prepare_worker_profiles(workers)
+        mp_context = multiprocessing.get_context("spawn")
+        slot_counter = mp_context.Value("i", 0)
+        try:
+            with mp_context.Pool(workers, initializer=_init_job_worker, initargs=(slot_counter,)) as pool:
+                pool.starmap(_run_job_chain, job_args)
+        finally:
+            # Fold in whatever the workers recorded, also after a crash or Ctrl+C
+            self._merge_tracking_shards(
+                tracking_data, [_job_shard_path(self.tracking_file, job_idx) for job_idx in range(1, job_count + 1)]
+            )
+
+    @staticmethod
+    def _chain_jobs_sharing_projects(job_queue):
+        """Group queued jobs so that jobs sharing a project land in the same chain.
+        Run side by side, such jobs would stamp the same folder and video names
+        (e.g. one project queued with two avatars) and pick up each other's videos.
+        Returns: list of chains, each a list of (job_idx, job) in queue order
+        """
+        chains = []  # (project names, [(job_idx, job), ...])
+        for job_idx, job in enumerate(job_queue, 1):
+            names = {project_name for project_name, _ in job["projects"]}
+            jobs = [(job_idx, job)]
+            for chain in [chain for chain in chains if chain[0] & names]:
+                chains.remove(chain)
+                names |= chain[0]
+                jobs = chain[1] + jobs
+            jobs.sort(key=lambda item: item[0])
+            chains.append((names, jobs))
+        chains.sort(key=lambda chain: chain[1][0][0])
+        return [jobs for _, jobs in chains]
+
+    def _merge_tracking_shards(self, tracking_data, shard_paths):
+        """Append the projects recorded in worker tracking shards to tracking_data,
+        save it, and remove the shards (and their logs)
+        """
+        self._index_tracking(tracking_data)
+        for shard_path in shard_paths:
+            reader = HeyGenAutomation()
+            reader.tracking_file = shard_path
+            shard = reader.load_tracking()
+            if not shard:
+                continue
+            for project in shard["projects"]:
+                tracking_data["projects"].append(project)
+                self._project_index.setdefault(project["project_name"], project)
+                for video in project["videos"]:
+                    self._video_index.setdefault(video["scene_folder"], video)
+        self.save_tracking(tracking_data)
+        for shard_path in shard_paths:
+            for path in (shard_path, shard_path + ".log"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
     def run_unattended_mode(self):
         """Submit all videos, then keep polling and downloading until all complete"""
-        
-        print("\n" + "="*60)
-        print("🌙 UNATTENDED OVERNIGHT MODE (QUEUE SYSTEM)")
-        print("="*60)
-        
-        # 0. Check for Resume
-        resume_mode = False
-        existing_tracking = self.load_tracking()
-        
-        if existing_tracking and "projects" in existing_tracking and len(existing_tracking["projects"]) > 0:
-            print("\n⚠️ Found existing tracking session from:", existing_tracking.get("session_start", "Unknown"))
-            resume_choice = input("👉 Resume this session? (1. Yes / 2. Start New): ").strip()
-            if resume_choice == "1":
-                print("✅ Resuming previous session...")
-                tracking_data = existing_tracking
-                resume_mode = True
-            else:
-                print("🆕 Starting fresh session (old tracking.json overwritten)")
-                tracking_data = self.create_new_tracking_session()
-                self.save_tracking(tracking_data)
-        else:
-            tracking_data = self.create_new_tracking_session()
-            self.save_tracking(tracking_data)
-
-        job_queue = []
-        config = {}
-        
-        if not resume_mode:
-            # 1. Build the Queue
-            job_queue = self.build_job_queue()
-            if not job_queue:
-                print("❌ No jobs queued.")
-                return
-                
-            # Get user preferences (Quality/FPS) - Global for all
-            config = self.get_user_preferences()
-        else:
-             print("⏩ Skipping Queue Builder (Resume Mode)")
-             config = {"quality": "720p", "fps": "25", "subtitles": "yes"} # Default filler
-        
-        with sync_playwright() as p:
-            context = self.launch_browser(p)
-            if not context:
-                return
-            
-            try:
-                page = self._get_or_create_page(context)
-                
-                # Navigate to HeyGen
-                print("🌐 Navigating to HeyGen...")
-                page.goto("https://www.heygen.com/")
-                time.sleep(3)
-                
-                print("\n" + "="*60)
-                print("📤 PHASE 1: PROCESS SUBMISSION QUEUE")
-                print("="*60 + "\n")
-                
-                job_count = len(job_queue)
-                for job_idx, job in enumerate(job_queue, 1):
-                    avatar_name = job["avatar"]
-                    projects_data = job["projects"]
-                    
-                    print(f"\n🏭 Processing Job {job_idx}/{job_count}")
-                    print(f"   👤 Avatar: {avatar_name}")
-                    print(f"   📂 Projects: {[p[0] for p in projects_data]}")
-                    
-                    config["avatar_name"] = avatar_name
-                    
-                    for project_name, scene_list in projects_data:
-                        print(f"\n   👉 Starting Project: {project_name}")
-                        
-                        # Create unique folder
-                        folder_datetime = datetime.now().strftime("%m-%d-%Y %I-%M %p")
-                        heygen_folder_name = f"{folder_datetime} {project_name}"
-                        
-                        # Add project to tracking
-                        self.add_project_to_tracking(tracking_data, project_name, heygen_folder_name, config)
-                        self.save_tracking(tracking_data)
-                        
-                        # Create Folder on HeyGen
-                        self._create_heygen_folder(page, heygen_folder_name)
-                        
-                        # Process Scenes
-                        total_scenes = len(scene_list)
-                        for scene_idx, (scene_folder, script_path, script_filename) in enumerate(scene_list, 1):
-                            print(f"\n   🎬 Submitting Scene {scene_idx}/{total_scenes}: {scene_folder}")
-                            
-                            success = self._submit_single_video(
-                                page, scene_folder, script_path, script_filename,
-                                config, heygen_folder_name, avatar_name, tracking_data, project_name
-                            )
-                            
-                            if success:
-                                print(f"   ✅ Scene submitted!")
-                            else:
-                                print(f"   ❌ Scene failed!")
-                                
-                            if scene_idx < total_scenes:
-                                time.sleep(5)
-                                
-                    print(f"\n✅ Job {job_idx} Complete!")
-                
-                # Phase 2: Poll and Download
-                print("\n" + "="*60)
-                print("📥 PHASE 2: WAITING & DOWNLOADING")
-                print("="*60)
-                
-                tracking_data = self._poll_and_download_loop(page, tracking_data)
-                
-                print("\n🎉 WORKFLOW COMPLETE!")
-                
-            except KeyboardInterrupt:
-                print("\n\n⚠️ Stopped by user (Ctrl+C)")
-            except Exception as e:
-                print(f"\n❌ Error during unattended mode: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                context.close()
-                print("✅ Browser closed.")
+        
+        print("\n" + "="*60)
+        print("🌙 UNATTENDED OVERNIGHT MODE (QUEUE SYSTEM)")
+        print("="*60)
+        
+        # 0. Check for Resume
+        resume_mode = False
+        existing_tracking = self.load_tracking()
+        
+        if existing_tracking and "projects" in existing_tracking and len(existing_tracking["projects"]) > 0:
+            print("\n⚠️ Found existing tracking session from:", existing_tracking.get("session_start", "Unknown"))
+            resume_choice = input("👉 Resume this session? (1. Yes / 2. Start New): ").strip()
+            if resume_choice == "1":
+                print("✅ Resuming previous session...")
+                tracking_data = existing_tracking
+                resume_mode = True
+            else:
+                print("🆕 Starting fresh session (old tracking.json overwritten)")
+                tracking_data = self.create_new_tracking_session()
+                self.save_tracking(tracking_data)
+        else:
+            tracking_data = self.create_new_tracking_session()
+            self.save_tracking(tracking_data)
+
+        job_queue = []
+        config = {}
+        
+        if not resume_mode:
+            # 1. Build the Queue
+            job_queue = self.build_job_queue()
+            if not job_queue:
+                print("❌ No jobs queued.")
+                return
+                
+            # Get user preferences (Quality/FPS) - Global for all
+            config = self.get_user_preferences()
+        else:
+             print("⏩ Skipping Queue Builder (Resume Mode)")
+             config = {"quality": "720p", "fps": "25", "subtitles": "yes"} # Default filler
+        
+        # Several jobs: submit them from separate processes, then poll from this one
+        job_workers = min(len(job_queue), self.submission_concurrency)
+        if job_workers > 1:
+            try:
+                self._run_jobs_in_processes(job_queue, config, tracking_data, job_workers)
+            except KeyboardInterrupt:
+                print("\n\n⚠️ Stopped by user (Ctrl+C)")
+                return
+            except Exception as e:
+                # Submitted jobs were merged into tracking; poll for those
+                print(f"\n❌ Error while submitting jobs: {e}")
+                traceback.print_exc()
+            job_queue = []
+        
+        with self._browser_session("unattended mode") as page:
+            if page is None:
+                return
+            
+            print("\n" + "="*60)
+            print("📤 PHASE 1: PROCESS SUBMISSION QUEUE")
+            print("="*60 + "\n")
+            
+            job_count = len(job_queue)
+            for job_idx, job in enumerate(job_queue, 1):
+                self._process_job(page, job_idx, job_count, job, config, tracking_data)
+            
+            # Phase 2: Poll and Download
+            print("\n" + "="*60)
+            print("📥 PHASE 2: WAITING & DOWNLOADING")
+            print("="*60)
+            
+            tracking_data = self._poll_and_download_loop(page, tracking_data)
+            
+            print("\n🎉 WORKFLOW COMPLETE!")
 
     def run_ui_queue(self, queue_path):
         """Submit videos from the web UI queue (no inputFiles needed)"""
@@ -1892,114 +2682,216 @@ class HeyGenAutomation:
         if not avatar_name:
             print("❌ Avatar name is required.")
             return
-        valid_items = [item for item in items if str(item.get("script", "")).strip()]
+        # Normalize titles, scripts and file names up front; the submit loop only unpacks them
+        valid_items = []
+        for item in items:
+            script_text = str(item.get("script", "")).strip()
+            if not script_text:
+                continue
+            idx = len(valid_items) + 1
+            title = str(item.get("title", "")).strip() or f"Untitled {idx}"
+            script_filename = self._sanitize_filename(title) or f"pasted_{idx}"
+            valid_items.append((title, script_text, script_filename))
 
         if not valid_items:
             print("❌ Queue is empty.")
             return
 
-        folder_datetime = datetime.now().strftime("%m-%d-%Y %I-%M %p")
-        heygen_folder_name = f"{folder_datetime} {project_name}"
+        started_at = datetime.now()
+        heygen_folder_name = f"{started_at:{FOLDER_DATETIME_FORMAT}} {project_name}"
 
         tracking_data = self.create_new_tracking_session()
-        self.add_project_to_tracking(tracking_data, project_name, heygen_folder_name, config)
+        self.add_project_to_tracking(tracking_data, project_name, heygen_folder_name, config, timestamp=started_at.isoformat())
         self.save_tracking(tracking_data)
 
-        with sync_playwright() as p:
-            context = self.launch_browser(p)
-            if not context:
+        with self._browser_session("UI queue submission") as page:
+            if page is None:
                 return
 
-            try:
-                page = self._get_or_create_page(context)
+            print("\n" + "="*60)
+            print("🚀 Starting UI Queue Submission")
+            print("="*60 + "\n")
 
-                print("🌐 Navigating to HeyGen...")
-                page.goto("https://www.heygen.com/")
-                time.sleep(3)
+            if not self._create_heygen_folder(page, heygen_folder_name):
+                return
 
+            total_items = len(valid_items)
+            for idx, (title, script_text, script_filename) in enumerate(valid_items, 1):
                 print("\n" + "="*60)
-                print("🚀 Starting UI Queue Submission")
+                print(f"🎬 Processing {idx}/{total_items}: {title}")
                 print("="*60 + "\n")
 
-                self._create_heygen_folder(page, heygen_folder_name)
+                success = self._submit_single_video(
+                    page, title, None, script_filename,
+                    config, heygen_folder_name, avatar_name, tracking_data, project_name,
+                    script_text=script_text
+                )
 
-                total_items = len(valid_items)
-                for idx, item in enumerate(valid_items, 1):
-                    title = str(item.get("title", "")).strip()
-                    if not title:
-                        title = f"Untitled {idx}"
+                if not success:
+                    return
 
-                    script_text = str(item.get("script", "")).strip()
+                print(f"✅ Submitted: {title}")
 
-                    script_filename = self._sanitize_filename(title)
-                    if not script_filename:
-                        script_filename = f"pasted_{idx}"
+            print("\n" + "="*60)
+            print("🎉 QUEUE SUBMISSION COMPLETE!")
+            print("="*60)
+            print(f"\n📁 Project: {project_name}")
+            print(f"📹 Videos submitted: {total_items}")
+            print(f"📋 Tracking file: {self.tracking_file}")
+            print(f"📂 HeyGen folder: {heygen_folder_name}")
+            print("\n📥 Auto-download enabled. Waiting for videos to finish...")
+            print("   This will keep running until all videos download (Ctrl+C to stop).")
+            print("\n" + "="*60 + "\n")
 
-                    print("\n" + "="*60)
-                    print(f"🎬 Processing {idx}/{total_items}: {title}")
-                    print("="*60 + "\n")
+            print("\n" + "="*60)
+            print("📥 PHASE 2: WAITING & DOWNLOADING")
+            print("="*60)
+            tracking_data = self._poll_and_download_loop(page, tracking_data)
 
-                    success = self._submit_single_video(
-                        page, title, None, script_filename,
-                        config, heygen_folder_name, avatar_name, tracking_data, project_name,
-                        script_text=script_text
-                    )
+            print("\n🎉 UI WORKFLOW COMPLETE!")
 
-                    if not success:
-                        return
+        print("✅ UI queue mode complete.")
 
-                    print(f"✅ Submitted: {title}")
-
-                    if idx < total_items:
-                        print("\n⏳ Waiting 5 seconds before next submission...")
-                        time.sleep(5)
-
-                print("\n" + "="*60)
-                print("🎉 QUEUE SUBMISSION COMPLETE!")
-                print("="*60)
-                print(f"\n📁 Project: {project_name}")
-                print(f"📹 Videos submitted: {total_items}")
-                print(f"📋 Tracking file: {self.tracking_file}")
-                print(f"📂 HeyGen folder: {heygen_folder_name}")
-                print("\n📥 Auto-download enabled. Waiting for videos to finish...")
-                print("   This will keep running until all videos download (Ctrl+C to stop).")
-                print("\n" + "="*60 + "\n")
-
-                print("\n" + "="*60)
-                print("📥 PHASE 2: WAITING & DOWNLOADING")
-                print("="*60)
-                tracking_data = self._poll_and_download_loop(page, tracking_data)
-
-                print("\n🎉 UI WORKFLOW COMPLETE!")
-
-            except Exception as e:
-                print(f"\n❌ Error during UI queue submission: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                context.close()
-                print("✅ UI queue mode complete. Browser closed.")
+    def _check_playwright_version(self):
+        """Tell the user to upgrade when the installed Playwright is older than MIN_PLAYWRIGHT_VERSION
+        Returns: True if the version is recent enough (or can't be determined)
+        """
+        try:
+            installed = importlib.metadata.version("playwright")
+            version = tuple(int(part) for part in installed.split(".")[:2])
+        except (importlib.metadata.PackageNotFoundError, ValueError):
+            return True
+        if version >= MIN_PLAYWRIGHT_VERSION:
+            return True
+        required = ".".join(map(str, MIN_PLAYWRIGHT_VERSION))
+        print(f"❌ Playwright {installed} is too old; version {required} or newer is required.")
+        print(f'   Run: python -m pip install --upgrade "playwright>={required}"')
+        print("   Then: python -m playwright install")
+        return False
 
     def run(self):
         """Main entry point with mode selection"""
+        if not self._check_playwright_version():
+            return
         parser = argparse.ArgumentParser(add_help=False)
         parser.add_argument("--ui-queue", dest="ui_queue", help="Path to UI queue JSON")
         args, _ = parser.parse_known_args()
         
-        if args.ui_queue:
-            self.run_ui_queue(args.ui_queue)
-            return
-        
-        mode = self.get_mode_selection()
-        
-        if mode == "submit":
-            self.run_submission_mode()
-        elif mode == "download":
-            self.run_download_mode()
-        elif mode == "unattended":
-            self.run_unattended_mode()
-
-if __name__ == "__main__":
-    automation = HeyGenAutomation()
-    automation.run()
-
+        try:
+            if args.ui_queue:
+                self.run_ui_queue(args.ui_queue)
+                return
+            
+            mode = self.get_mode_selection()
+            
+            if mode == "submit":
+                self.run_submission_mode()
+            elif mode == "download":
+                self.run_download_mode()
+            elif mode == "unattended":
+                self.run_unattended_mode()
+        finally:
+            self.flush_tracking()
+            self._browser_pool.close_all()
+
+# Profile slot of the current job worker process (see _run_jobs_in_processes)
+_worker_slot = 0
+
+
+def _init_job_worker(slot_counter):
+    """Pool initializer: give each worker process its own profile slot"""
+    global _worker_slot
+    with slot_counter.get_lock():
+        slot_counter.value += 1
+        _worker_slot = slot_counter.value
+    # Workers share the parent's stdout; write whole lines so their output does not
+    # interleave mid-line (block buffering would hold progress back until exit)
+    sys.stdout.reconfigure(line_buffering=True)
+
+
+def _job_shard_path(tracking_file, job_idx):
+    """Tracking file a job worker process records its submissions in"""
+    return f"{tracking_file}.job{job_idx}.json"
+
+
+def _run_one_job(job_idx, job_count, job, config, tracking_file):
+    """Submit one queued job end to end in a worker process.
+    Submissions are recorded in the job's tracking shard; errors are reported, not raised.
+    Returns: the tracking shard path
+    """
+    automation = HeyGenAutomation()
+    automation.cdp_url = ""
+    automation.submission_concurrency = 1
+    automation.tracking_file = _job_shard_path(tracking_file, job_idx)
+    tracking_data = automation.create_new_tracking_session()
+    automation.save_tracking(tracking_data)
+
+    try:
+        automation.profile_dir = automation._worker_profile_dir(_worker_slot)
+        with sync_playwright() as p:
+            context = automation.launch_browser(p)
+            if not context:
+                print(f"\n❌ Job {job_idx}: browser could not be started")
+                return automation.tracking_file
+            try:
+                page = automation._get_or_create_page(context)
+                automation._open_heygen_home(page)
+                automation._process_job(page, job_idx, job_count, job, dict(config), tracking_data)
+            finally:
+                context.close()
+    except Exception as e:
+        print(f"\n❌ Error during job {job_idx}: {e}")
+    finally:
+        automation.save_tracking(tracking_data)
+    return automation.tracking_file
+
+
+def _run_job_chain(job_chain, job_count, config, tracking_file):
+    """Submit a chain of jobs that share projects one after another in a worker process
+    (see _chain_jobs_sharing_projects).
+    Returns: the tracking shard paths
+    """
+    return [_run_one_job(job_idx, job_count, job, config, tracking_file) for job_idx, job in job_chain]
+
+
+def _submit_scene_batch(worker_id, scene_batch, config, heygen_folder_name, avatar_name, project_name, tracking_file):
+    """Submit a share of a project's scenes from a separate browser.
+    Runs on a worker thread with its own Playwright instance and profile copy.
+    Each submission is appended to the main tracking log as it happens; the worker
+    never saves tracking_file itself, since it only holds this project's new videos.
+    Returns: the tracking entries of the videos that were submitted
+    """
+    automation = HeyGenAutomation()
+    automation.cdp_url = ""  # Workers never share the attached browser's tab
+    automation.submission_concurrency = 1
+    automation.tracking_file = tracking_file
+    tracking_data = automation.create_new_tracking_session()
+    automation.add_project_to_tracking(tracking_data, project_name, heygen_folder_name, config)
+
+    try:
+        automation.profile_dir = automation._worker_profile_dir(worker_id)
+        with sync_playwright() as p:
+            context = automation.launch_browser(p)
+            if not context:
+                return []
+            try:
+                page = automation._get_or_create_page(context)
+                automation._open_heygen_home(page)
+                for scene_idx, (scene_folder, script_path, script_filename) in enumerate(scene_batch, 1):
+                    print(f"\n   🎬 [worker {worker_id}] Submitting Scene {scene_idx}/{len(scene_batch)}: {scene_folder}")
+                    if not automation._submit_single_video(
+                        page, scene_folder, script_path, script_filename,
+                        config, heygen_folder_name, avatar_name, tracking_data, project_name
+                    ):
+                        print(f"   ❌ [worker {worker_id}] Scene failed: {scene_folder}")
+            finally:
+                context.close()
+    except Exception as e:
+        print(f"\n❌ [worker {worker_id}] Error during submission: {e}")
+    return tracking_data["projects"][0]["videos"]
+
+
+if __name__ == "__main__":
+    automation = HeyGenAutomation()
+    automation.run()
+
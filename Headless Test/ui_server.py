@@ -14,11 +14,20 @@ except ImportError:
     print("Flask is not installed. Run: python3 -m pip install flask")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 QUEUE_FILE = os.path.join(SCRIPT_DIR, "ui_queue.json")
 HEYGEN_SCRIPT = os.path.join(SCRIPT_DIR, "heygen_automation.py")
 UI_HOST = os.getenv("HEYGEN_UI_HOST", "127.0.0.1").strip() or "127.0.0.1"
 UI_PORT = int(os.getenv("HEYGEN_UI_PORT", "5000"))
+# Starts the automation process; tests swap in a stand-in. Popen rather than
+# os.posix_spawn: on Linux it already execs via vfork, it can set the working
+# directory and log redirection, and it reaps the child once it exits.
+_spawn = subprocess.Popen
 
 
 def pick_open_port(host, port):
@@ -38,22 +47,40 @@ def pick_open_port(host, port):
 
 app = Flask(__name__, static_folder="ui_static", template_folder="ui_templates")
 
+# Parsed avatar list, reused until config.txt changes on disk (key: path, mtime, size)
+_AVATAR_CACHE = {"key": None, "data": []}
+
 
 def load_avatars():
     """Load avatar names from config.txt."""
     config_path = os.path.join(SCRIPT_DIR, "config.txt")
     avatars = []
     try:
-        if os.path.exists(config_path):
-            with open(config_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                for line in content.splitlines():
-                    if "available_avatars:" in line:
-                        parts = line.split("available_avatars:")[1].split(",")
-                        avatars = [nominal.strip() for nominal in parts if nominal.strip()]
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        return avatars
+    except OSError as exc:
+        print(f"Warning: failed to load avatars: {exc}")
+        return avatars
+
+    key = (config_path, stat.st_mtime_ns, stat.st_size)
+    if _AVATAR_CACHE["key"] == key:
+        # Callers may modify the list they get back
+        return list(_AVATAR_CACHE["data"])
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        # Find the key in the whole buffer rather than splitting every line
+        _, found, rest = content.partition("available_avatars:")
+        if found:
+            line = rest.split("\n", 1)[0]
+            avatars = [nominal.strip() for nominal in line.split(",") if nominal.strip()]
     except Exception as exc:
         print(f"Warning: failed to load avatars: {exc}")
-    return avatars
+        return avatars
+    _AVATAR_CACHE.update(key=key, data=avatars)
+    return list(avatars)
 
 
 def save_avatars(avatars):
@@ -64,6 +91,8 @@ def save_avatars(avatars):
         line += " " + ", ".join(avatars)
     with open(config_path, "w", encoding="utf-8") as f:
         f.write(line + "\n")
+    # A rewrite within the same mtime tick must not serve the old list
+    _AVATAR_CACHE["key"] = None
 
 
 @app.route("/")
@@ -148,15 +177,41 @@ def start():
         "items": safe_items,
     }
 
-    with open(QUEUE_FILE, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    process = _write_queue_and_spawn(payload)
+    return jsonify({"ok": True, "pid": process.pid})
 
-    process = subprocess.Popen(
-        [sys.executable, HEYGEN_SCRIPT, "--ui-queue", QUEUE_FILE],
-        cwd=SCRIPT_DIR,
-    )
 
-    return jsonify({"ok": True, "pid": process.pid})
+def _write_queue_and_spawn(payload):
+    """Write the queue file and launch the automation process on it."""
+    # Compact JSON: the file is only read back by the automation script
+    if orjson is not None:
+        raw = orjson.dumps(payload)
+    else:
+        # ASCII output keeps json on its fast C path; the reader decodes \u escapes
+        raw = json.dumps(payload).encode("ascii")
+    # Write a temp file and swap it in so the automation never reads a partial queue
+    tmp_path = QUEUE_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, QUEUE_FILE)
+
+    # Detach the run so it outlives the UI server; its output goes to ui_queue.log
+    kwargs = {"cwd": SCRIPT_DIR, "stdin": subprocess.DEVNULL, "stderr": subprocess.STDOUT}
+    # Redirected output would otherwise use the ANSI code page on Windows (the emoji in
+    # the progress messages fail to encode) and be block-buffered, so the log stays empty
+    kwargs["env"] = {**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUNBUFFERED": "1"}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+    else:
+        kwargs["start_new_session"] = True
+
+    log_path = os.path.splitext(QUEUE_FILE)[0] + ".log"
+    with open(log_path, "ab", buffering=0) as log_file:
+        return _spawn(
+            [sys.executable, HEYGEN_SCRIPT, "--ui-queue", QUEUE_FILE],
+            stdout=log_file,
+            **kwargs,
+        )
 
 
 if __name__ == "__main__":
@@ -173,5 +228,10 @@ if __name__ == "__main__":
     if UI_HOST in {"127.0.0.1", "0.0.0.0", "localhost"}:
         print(f"If it doesn't open, try http://127.0.0.1:{UI_PORT}")
 
-    threading.Timer(0.6, lambda: webbrowser.open(ui_url)).start()
-    app.run(host=UI_HOST, port=UI_PORT, debug=False)
+    # Open a browser tab only for interactive starts; HEYGEN_OPEN_BROWSER=0 turns it off
+    if os.getenv("HEYGEN_OPEN_BROWSER", "1").strip() == "1" and sys.stdout.isatty():
+        threading.Timer(0.6, lambda: webbrowser.open(ui_url)).start()
+    else:
+        print("Not opening a browser (HEYGEN_OPEN_BROWSER=0 or no terminal).")
+    # One thread per request so /avatars polls are not held up behind /start
+    app.run(host=UI_HOST, port=UI_PORT, debug=False, threaded=True)
@@ -1,9 +1,7 @@
 import http.server
 import threading
 import unittest
-from pathlib import Path
 import sys
-from functools import partial
 
 try:
     from playwright.sync_api import sync_playwright
@@ -12,29 +10,96 @@ except Exception:
     PLAYWRIGHT_AVAILABLE = False
 
 
-class QuietHandler(http.server.SimpleHTTPRequestHandler):
+EDITOR_HTML = b"""
+<html>
+  <body>
+    <div id="editor" contenteditable="true"></div>
+  </body>
+</html>
+"""
+
+# Like ProseMirror, this editor inserts pasted text from its own paste handler
+PASTE_HANDLER_EDITOR_HTML = b"""
+<html>
+  <body>
+    <div id="editor" contenteditable="true"></div>
+    <script>
+      document.getElementById('editor').addEventListener('paste', (event) => {
+        event.preventDefault();
+        document.execCommand('insertText', false, event.clipboardData.getData('text/plain'));
+      });
+    </script>
+  </body>
+</html>
+"""
+
+# Round-trips each case through the clipboard and pastes it into an emptied editor with a
+# synthetic paste event (Chromium rejects execCommand('paste') from scripts), all in one
+# round-trip. Returns the editor text per case, or null if synthetic paste events are unsupported.
+RUN_CLIPBOARD_CASES_JS = """
+async (cases) => {
+  if (typeof ClipboardEvent !== 'function' || typeof DataTransfer !== 'function') return null;
+  const editor = document.getElementById('editor');
+  const out = [];
+  for (const text of cases) {
+    editor.textContent = '';
+    editor.focus();
+    await navigator.clipboard.writeText(text);
+    const data = new DataTransfer();
+    data.setData('text/plain', await navigator.clipboard.readText());
+    editor.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+    out.push(editor.textContent);
+  }
+  return out;
+}
+"""
+
+
+class MemoryHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the server's html_body for every GET, without touching the disk."""
+
+    def do_GET(self):
+        body = self.server.html_body
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, format, *args):
         return
 
 
 class TestClipboardSimulation(unittest.TestCase):
-    @unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "Playwright not installed")
+    @classmethod
+    def setUpClass(cls):
+        # One browser for the class; each test gets its own context
+        cls._pw = None
+        cls._browser = None
+        cls._skip_reason = None
+        if not PLAYWRIGHT_AVAILABLE:
+            cls._skip_reason = "Playwright not installed"
+            return
+        cls._pw = sync_playwright().start()
+        try:
+            cls._browser = cls._pw.chromium.launch(headless=True)
+        except Exception as exc:
+            cls._skip_reason = f"Playwright browser not installed: {exc}"
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._browser:
+            cls._browser.close()
+        if cls._pw:
+            cls._pw.stop()
+
     def test_clipboard_paste_into_contenteditable(self):
-        html = """
-        <html>
-          <body>
-            <div id=\"editor\" contenteditable=\"true\"></div>
-          </body>
-        </html>
-        """
-
-        with self._serve_html(html) as base_url:
-            with sync_playwright() as p:
-                try:
-                    browser = p.chromium.launch(headless=True)
-                except Exception as exc:
-                    self.skipTest(f"Playwright browser not installed: {exc}")
-                context = browser.new_context()
+        if self._skip_reason:
+            self.skipTest(self._skip_reason)
+
+        with self._serve_html() as base_url:
+            context = self._browser.new_context()
+            try:
                 context.grant_permissions(["clipboard-read", "clipboard-write"], origin=base_url)
                 page = context.new_page()
                 page.goto(base_url + "/index.html")
@@ -49,22 +114,44 @@ class TestClipboardSimulation(unittest.TestCase):
                 modifier = "Meta" if sys.platform == "darwin" else "Control"
                 page.keyboard.press(f"{modifier}+v")
                 content = page.eval_on_selector("#editor", "el => el.textContent")
-
-                browser.close()
+            finally:
+                context.close()
 
         self.assertEqual(content, test_text)
 
-    def _serve_html(self, html):
-        temp_dir = Path(__file__).parent / "_tmp_clipboard"
-        temp_dir.mkdir(exist_ok=True)
-        index_path = temp_dir / "index.html"
-        index_path.write_text(html, encoding="utf-8")
-
-        handler = partial(QuietHandler, directory=str(temp_dir))
+    def test_clipboard_paste_cases_batched(self):
+        if self._skip_reason:
+            self.skipTest(self._skip_reason)
 
-        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        cases = ["Clipboard test", "Ünïcödé — ✓", 'Scene 2: "quotes" & <tags>']
+        with self._serve_html(PASTE_HANDLER_EDITOR_HTML) as base_url:
+            context = self._browser.new_context()
+            try:
+                context.grant_permissions(["clipboard-read", "clipboard-write"], origin=base_url)
+                page = context.new_page()
+                page.goto(base_url + "/index.html")
+                results = self._run_clipboard_cases(page, cases)
+            finally:
+                context.close()
+
+        self.assertEqual(len(results), len(cases))
+        for text, content in zip(cases, results):
+            with self.subTest(text=text):
+                self.assertEqual(content, text)
+
+    def _run_clipboard_cases(self, page, cases):
+        results = page.evaluate(RUN_CLIPBOARD_CASES_JS, cases)
+        if results is None:
+            self.skipTest("Synthetic paste events not supported")
+        return results
+
+    def _serve_html(self, html_body=EDITOR_HTML):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), MemoryHandler)
+        server.html_body = html_body
         port = server.server_address[1]
-        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        # A short poll interval lets shutdown() return promptly instead of after up to 0.5s.
+        # Closing the socket without shutdown() would leave serve_forever spinning on it.
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
         thread.start()
 
         class _Context:
@@ -73,12 +160,8 @@ class TestClipboardSimulation(unittest.TestCase):
 
             def __exit__(self_inner, exc_type, exc, tb):
                 server.shutdown()
+                server.server_close()
                 thread.join(timeout=2)
-                try:
-                    index_path.unlink()
-                    temp_dir.rmdir()
-                except Exception:
-                    pass
 
         return _Context()
 
@@ -1,9 +1,13 @@
+import contextlib
 import importlib.util
+import io
 import json
 import tempfile
 import unittest
 from pathlib import Path
 
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "Headless Test" / "heygen_automation.py"
+
 
 def load_module(name, path):
     spec = importlib.util.spec_from_file_location(name, path)
@@ -13,27 +17,39 @@ def load_module(name, path):
 
 
 class TestConfigAndTracking(unittest.TestCase):
-    def setUp(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        module_path = repo_root / "Headless Test" / "heygen_automation.py"
-        self.automation_mod = load_module("heygen_automation", module_path)
+    @classmethod
+    def setUpClass(cls):
+        cls.automation_mod = load_module("heygen_automation", _MODULE_PATH)
+        # One temp dir for the class, with a fresh sub-directory per test
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_path = Path(self.temp_dir.name)
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        self.temp_path = Path(self.temp_dir.name) / self._testMethodName
+        self.temp_path.mkdir()
         self.tracking_file = self.temp_path / "tracking.json"
         self.config_file = self.temp_path / "config.txt"
 
         self.automation = self.automation_mod.HeyGenAutomation()
         self.automation.tracking_file = str(self.tracking_file)
-
-    def tearDown(self):
-        self.temp_dir.cleanup()
+        self.automation.config_file = str(self.config_file)
 
     def test_load_config(self):
         self.config_file.write_text("available_avatars: Alpha, Beta, Gamma\n", encoding="utf-8")
         avatars = self.automation.load_config()
         self.assertEqual(avatars, ["Alpha", "Beta", "Gamma"])
 
+    def test_load_config_picks_up_changes(self):
+        self.config_file.write_text("available_avatars: Alpha\n", encoding="utf-8")
+        self.automation.load_config().append("Mutated")
+        self.assertEqual(self.automation.load_config(), ["Alpha"])
+
+        self.config_file.write_text("available_avatars: Alpha, Beta\n", encoding="utf-8")
+        self.assertEqual(self.automation.load_config(), ["Alpha", "Beta"])
+
     def test_tracking_roundtrip(self):
         data = {"session_start": "now", "projects": []}
         ok = self.automation.save_tracking(data)
@@ -41,6 +57,129 @@ class TestConfigAndTracking(unittest.TestCase):
         loaded = self.automation.load_tracking()
         self.assertEqual(loaded, data)
 
+    def test_tracking_deferred_save(self):
+        data = {"session_start": "now", "projects": []}
+        self.assertTrue(self.automation.save_tracking(data, defer=True))
+        self.assertFalse(self.tracking_file.exists())
+
+        self.assertTrue(self.automation.flush_tracking())
+        self.assertEqual(self.automation.load_tracking(), data)
+        self.assertEqual(list(self.temp_path.iterdir()), [self.tracking_file])
+
+    def test_tracking_deferred_save_flushed_before_log(self):
+        data = self.automation.create_new_tracking_session()
+        self.automation.add_project_to_tracking(data, "Project", "Folder", {})
+        self.automation.save_tracking(data, defer=True)
+        self.automation.save_tracking(data, defer=True)
+        self.assertFalse(self.tracking_file.exists())
+
+        self.automation.record_video_status(data, "Scene 1", "failed")
+        self.assertTrue(self.tracking_file.exists())
+
+    def test_update_video_status(self):
+        data = self.automation.create_new_tracking_session()
+        self.automation.add_project_to_tracking(data, "Project", "Folder", {})
+        self.automation.add_video_to_project(data, "Project", "Scene 1", "s1.txt", "Video 1")
+        self.automation.save_tracking(data)
+
+        loaded = self.automation.load_tracking()
+        self.automation.update_video_status(loaded, "Scene 1", "downloaded", "Video 1.mp4")
+        video = loaded["projects"][0]["videos"][0]
+        self.assertEqual(video["status"], "downloaded")
+        self.assertEqual(video["output_file"], "Video 1.mp4")
+        self.assertEqual(data["projects"][0]["videos"][0]["status"], "processing")
+
+    def test_tracking_log_replay(self):
+        data = self.automation.create_new_tracking_session()
+        self.automation.add_project_to_tracking(data, "Project", "Folder", {})
+        self.automation.save_tracking(data)
+
+        video = self.automation.add_video_to_project(data, "Project", "Scene 1", "s1.txt", "Video 1")
+        self.automation.append_tracking_event({"op": "add_video", "project": "Project", "video": video})
+        self.automation.record_video_status(data, "Scene 1", "downloaded", "Video 1.mp4")
+
+        reader = self.automation_mod.HeyGenAutomation()
+        reader.tracking_file = str(self.tracking_file)
+        self.assertEqual(reader.load_tracking(), data)
+
+        self.automation.save_tracking(data)
+        self.assertFalse(Path(self.automation.tracking_log_file).exists())
+        self.assertEqual(reader.load_tracking(), data)
+
+    def test_merge_tracking_shards(self):
+        shard_path = str(self.temp_path / "tracking.json.job1.json")
+        worker = self.automation_mod.HeyGenAutomation()
+        worker.tracking_file = shard_path
+        shard = worker.create_new_tracking_session()
+        worker.add_project_to_tracking(shard, "Project", "Folder", {})
+        worker.save_tracking(shard)
+        # Submitted after the last full save, as when a worker is killed mid-job
+        video = worker.add_video_to_project(shard, "Project", "Scene 1", "s1.txt", "Video 1")
+        worker.append_tracking_event({"op": "add_video", "project": "Project", "video": video})
+
+        data = self.automation.create_new_tracking_session()
+        missing_shard = str(self.temp_path / "tracking.json.job2.json")
+        self.automation._merge_tracking_shards(data, [shard_path, missing_shard])
+
+        self.assertEqual([p["project_name"] for p in data["projects"]], ["Project"])
+        self.assertEqual(data["projects"][0]["videos"][0]["video_name"], "Video 1")
+        self.assertEqual(self.automation.load_tracking(), data)
+        self.assertEqual(list(self.temp_path.iterdir()), [self.tracking_file])
+
+    def test_chain_jobs_sharing_projects(self):
+        jobs = [
+            {"avatar": "Alpha", "projects": [("A", []), ("B", [])]},
+            {"avatar": "Beta", "projects": [("C", [])]},
+            {"avatar": "Gamma", "projects": [("D", []), ("C", [])]},
+            {"avatar": "Beta", "projects": [("A", []), ("D", [])]},
+        ]
+        chains = self.automation_mod.HeyGenAutomation._chain_jobs_sharing_projects(jobs)
+        self.assertEqual([[job_idx for job_idx, _ in chain] for chain in chains], [[1, 2, 3, 4]])
+
+        chains = self.automation_mod.HeyGenAutomation._chain_jobs_sharing_projects(jobs[:2])
+        self.assertEqual([[job_idx for job_idx, _ in chain] for chain in chains], [[1], [2]])
+
+    def test_scan_project_scenes_sees_changed_scripts(self):
+        scene_dir = self.temp_path / "Project" / "Scene 1"
+        scene_dir.mkdir(parents=True)
+        (scene_dir / "a.txt").write_text("Hello", encoding="utf-8")
+        scenes = self.automation._scan_project_scenes(str(scene_dir.parent))
+        self.assertEqual(scenes, [("Scene 1", str(scene_dir / "a.txt"), "a.txt")])
+
+        (scene_dir / "a.txt").rename(scene_dir / "b.txt")
+        scenes = self.automation._scan_project_scenes(str(scene_dir.parent))
+        self.assertEqual(scenes, [("Scene 1", str(scene_dir / "b.txt"), "b.txt")])
+
+    def test_completed_render_names(self):
+        body = json.dumps({"data": {"list": [
+            {"id": "a", "title": "Old video", "status": "completed"},
+            {"id": "b", "title": "New video", "status": "processing"},
+        ]}})
+        names = self.automation_mod.HeyGenAutomation._completed_render_names(body)
+        self.assertEqual(names, {"Old video"})
+        self.assertEqual(self.automation_mod.HeyGenAutomation._completed_render_names("<html>"), set())
+
+    def test_browser_session_yields_none_when_setup_fails(self):
+        released = []
+
+        class Pool:
+            def acquire(self):
+                return "context"
+
+            def release(self, context):
+                released.append(context)
+
+        def fail_navigation(page):
+            raise RuntimeError("navigation failed")
+
+        self.automation._browser_pool = Pool()
+        self.automation._get_or_create_page = lambda context: "page"
+        self.automation._ensure_on_heygen = fail_navigation
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            with self.automation._browser_session("test") as page:
+                self.assertIsNone(page)
+        self.assertEqual(released, ["context"])
+
     def test_tracking_missing_file(self):
         if self.tracking_file.exists():
             self.tracking_file.unlink()
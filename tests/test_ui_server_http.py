@@ -1,14 +1,32 @@
+import http.client
 import importlib.util
 import json
 import tempfile
 import threading
 import unittest
-import urllib.request
-import urllib.error
 from pathlib import Path
 
 from werkzeug.serving import make_server
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "Headless Test" / "ui_server.py"
+
+
+def encode_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def decode_json(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 
 def load_module(name, path):
     spec = importlib.util.spec_from_file_location(name, path)
@@ -18,9 +36,10 @@ def load_module(name, path):
 
 
 class DummyProcess:
-    def __init__(self, args, cwd=None):
+    def __init__(self, args, cwd=None, **kwargs):
         self.args = args
         self.cwd = cwd
+        self.kwargs = kwargs
         self.pid = 12345
 
 
@@ -34,7 +53,7 @@ class UIServerHarness:
     def start(self):
         self.server = make_server("127.0.0.1", 0, self.app)
         self.port = self.server.server_port
-        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
         self.thread.start()
 
     def stop(self):
@@ -45,49 +64,71 @@ class UIServerHarness:
             self.thread.join(timeout=2)
 
 
-class TestUIServerHTTP(unittest.TestCase):
-    def setUp(self):
-        repo_root = Path(__file__).resolve().parents[1]
-        module_path = repo_root / "Headless Test" / "ui_server.py"
-        self.ui_server = load_module("ui_server", module_path)
+class UIServerTestCase(unittest.TestCase):
+    """Points ui_server at a fresh temp dir with a config.txt for each test."""
 
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_path = Path(self.temp_dir.name)
+    @classmethod
+    def setUpClass(cls):
+        cls.ui_server = load_module("ui_server", _MODULE_PATH)
+        # One temp dir for the class, with a fresh sub-directory per test
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        self.temp_path = Path(self.temp_dir.name) / self._testMethodName
+        self.temp_path.mkdir()
 
         self.ui_server.SCRIPT_DIR = str(self.temp_path)
         self.ui_server.QUEUE_FILE = str(self.temp_path / "ui_queue.json")
         self.ui_server.HEYGEN_SCRIPT = str(self.temp_path / "heygen_automation.py")
-        self.ui_server.subprocess.Popen = DummyProcess
+        self._orig_spawn = self.ui_server._spawn
+        self.spawned = []
+        self.ui_server._spawn = self._record_spawn
 
         self._write_config("available_avatars: Alpha, Beta\n")
 
-        self.harness = UIServerHarness(self.ui_server.app)
-        self.harness.start()
-
     def tearDown(self):
-        self.harness.stop()
-        self.temp_dir.cleanup()
+        self.ui_server._spawn = self._orig_spawn
+
+    def _record_spawn(self, *args, **kwargs):
+        process = DummyProcess(*args, **kwargs)
+        self.spawned.append(process)
+        return process
 
     def _write_config(self, content):
         config_path = self.temp_path / "config.txt"
         config_path.write_text(content, encoding="utf-8")
 
+
+class TestUIServerHTTP(UIServerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Requests go straight into the WSGI app, without a socket
+        cls.client = cls.ui_server.app.test_client()
+
     def _request(self, method, path, payload=None):
-        url = f"http://127.0.0.1:{self.harness.port}{path}"
         data = None
         if payload is not None:
-            data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=data, method=method)
-        req.add_header("Content-Type", "application/json")
-        with urllib.request.urlopen(req) as resp:
-            body = resp.read().decode("utf-8")
-            return resp.status, json.loads(body)
+            data = encode_json(payload)
+        resp = self.client.open(path, method=method, data=data, content_type="application/json")
+        return resp.status_code, resp.get_json()
 
     def test_avatars_get(self):
         status, data = self._request("GET", "/avatars")
         self.assertEqual(status, 200)
         self.assertEqual(data["avatars"], ["Alpha", "Beta"])
 
+    def test_avatars_get_sees_config_changes(self):
+        self._request("GET", "/avatars")
+        self._write_config("available_avatars: Alpha, Beta, Gamma\n")
+        status, data = self._request("GET", "/avatars")
+        self.assertEqual(status, 200)
+        self.assertEqual(data["avatars"], ["Alpha", "Beta", "Gamma"])
+
     def test_avatars_add_delete(self):
         status, data = self._request("POST", "/avatars", {"name": "Gamma"})
         self.assertEqual(status, 200)
@@ -116,15 +157,42 @@ class TestUIServerHTTP(unittest.TestCase):
         self.assertEqual(saved["avatar"], "Alpha")
         self.assertEqual(saved["project_name"], "Test Project")
         self.assertEqual(len(saved["items"]), 1)
+        self.assertEqual(self.spawned[0].kwargs["env"]["PYTHONIOENCODING"], "utf-8")
 
     def test_start_missing_avatar(self):
         payload = {
             "project_name": "Test Project",
             "items": [{"title": "Scene 1", "script": "Hello world"}],
         }
-        with self.assertRaises(urllib.error.HTTPError) as ctx:
-            self._request("POST", "/start", payload)
-        self.assertEqual(ctx.exception.code, 400)
+        status, data = self._request("POST", "/start", payload)
+        self.assertEqual(status, 400)
+        self.assertFalse(data["ok"])
+
+
+class TestUIServerSocket(UIServerTestCase):
+    """End-to-end check over a real werkzeug server and TCP connection."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.harness = UIServerHarness(cls.ui_server.app)
+        cls.harness.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.harness.stop()
+        super().tearDownClass()
+
+    def test_avatars_get(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.harness.port, timeout=10)
+        try:
+            conn.request("GET", "/avatars")
+            resp = conn.getresponse()
+            status, data = resp.status, decode_json(resp.read())
+        finally:
+            conn.close()
+        self.assertEqual(status, 200)
+        self.assertEqual(data["avatars"], ["Alpha", "Beta"])
 
 
 if __name__ == "__main__":